@@ -3,12 +3,13 @@ Authentication management commands for DeployX.
 """
 import os
 import webbrowser
-from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 from utils.ui import header, success, error, info, warning
 from platforms.github.cli_integration import GitHubCLIIntegration
 from platforms.vercel.cli_integration import VercelCLIIntegration
 from platforms.railway.cli_integration import RailwayCLIIntegration
+from platforms._http import get_session
+from core.constants import TOKEN_FILES
 
 def auth_status_command() -> bool:
     """Show authentication status for all platforms."""
@@ -31,11 +32,17 @@ def auth_status_command() -> bool:
     
     return True
 
-def auth_setup_command(platform: str) -> bool:
-    """Set up authentication for a specific platform."""
+def auth_setup_command(platform: str, input_fn: Callable[[str], str] = input,
+                       opener: Optional[Callable[[str], object]] = None) -> bool:
+    """
+    Set up authentication for a specific platform.
+    
+    Answers are read through input_fn and the token page is shown with
+    opener, which defaults to webbrowser.open.
+    """
     platform = platform.lower()
     
-    if platform not in ["github", "vercel", "railway", "netlify", "render"]:
+    if platform not in TOKEN_FILES:
         error(f"❌ Unknown platform: {platform}")
         return False
     
@@ -53,32 +60,32 @@ def auth_setup_command(platform: str) -> bool:
     is_configured, method, user = status_func()
     if is_configured:
         warning(f"⚠️ {platform.title()} is already configured via {method}" + (f" ({user})" if user else ""))
-        reconfigure = input("Do you want to reconfigure? (y/N): ").strip().lower()
+        reconfigure = input_fn("Do you want to reconfigure? (y/N): ").strip().lower()
         if reconfigure not in ['y', 'yes']:
             return True
     
     # Open token page and guide setup
-    return _setup_platform_auth(platform)
+    return _setup_platform_auth(platform, input_fn, opener)
 
 def auth_clear_command(platform: str) -> bool:
     """Clear stored authentication for a platform."""
     platform = platform.lower()
     
-    if platform not in ["github", "vercel", "railway", "netlify", "render"]:
+    if platform not in TOKEN_FILES:
         error(f"❌ Unknown platform: {platform}")
         return False
     
-    # Remove token file
-    token_file = Path(f'.deployx_{platform}_token')
-    if token_file.exists():
-        try:
-            token_file.unlink()
-            success(f"✅ Cleared {platform.title()} authentication")
-        except Exception as e:
-            error(f"❌ Failed to clear token: {e}")
-            return False
-    else:
+    # Remove token file; unlink reports a missing file itself, so no
+    # separate existence check is needed
+    token_file = TOKEN_FILES[platform]
+    try:
+        token_file.unlink()
+        success(f"✅ Cleared {platform.title()} authentication")
+    except FileNotFoundError:
         warning(f"⚠️ No stored token found for {platform.title()}")
+    except Exception as e:
+        error(f"❌ Failed to clear token: {e}")
+        return False
     
     return True
 
@@ -92,7 +99,7 @@ def _check_github_auth() -> tuple[bool, str, Optional[str]]:
         return True, "CLI", user
     
     # Check token file
-    token_file = Path('.deployx_github_token')
+    token_file = TOKEN_FILES['github']
     if token_file.exists():
         return True, "token file", None
     
@@ -112,7 +119,7 @@ def _check_vercel_auth() -> tuple[bool, str, Optional[str]]:
         return True, "CLI", user
     
     # Check token file
-    token_file = Path('.deployx_vercel_token')
+    token_file = TOKEN_FILES['vercel']
     if token_file.exists():
         return True, "token file", None
     
@@ -132,7 +139,7 @@ def _check_railway_auth() -> tuple[bool, str, Optional[str]]:
         return True, "CLI", user
     
     # Check token file
-    token_file = Path('.deployx_railway_token')
+    token_file = TOKEN_FILES['railway']
     if token_file.exists():
         return True, "token file", None
     
@@ -145,7 +152,7 @@ def _check_railway_auth() -> tuple[bool, str, Optional[str]]:
 def _check_netlify_auth() -> tuple[bool, str, Optional[str]]:
     """Check Netlify authentication status."""
     # Check token file
-    token_file = Path('.deployx_netlify_token')
+    token_file = TOKEN_FILES['netlify']
     if token_file.exists():
         return True, "token file", None
     
@@ -158,7 +165,7 @@ def _check_netlify_auth() -> tuple[bool, str, Optional[str]]:
 def _check_render_auth() -> tuple[bool, str, Optional[str]]:
     """Check Render authentication status."""
     # Check token file
-    token_file = Path('.deployx_render_token')
+    token_file = TOKEN_FILES['render']
     if token_file.exists():
         return True, "token file", None
     
@@ -168,7 +175,8 @@ def _check_render_auth() -> tuple[bool, str, Optional[str]]:
     
     return False, "", None
 
-def _setup_platform_auth(platform: str) -> bool:
+def _setup_platform_auth(platform: str, input_fn: Callable[[str], str] = input,
+                         opener: Optional[Callable[[str], object]] = None) -> bool:
     """Set up authentication for a platform with guided flow."""
     token_urls = {
         "github": "https://github.com/settings/tokens/new?scopes=repo,workflow&description=DeployX%20CLI",
@@ -191,20 +199,21 @@ def _setup_platform_auth(platform: str) -> bool:
         info(f"📝 {instructions[platform]}")
         
         # Ask if user wants to open the page
-        open_page = input(f"🔗 Open {platform.title()} token page? (Y/n): ").strip().lower()
+        open_page = input_fn(f"🔗 Open {platform.title()} token page? (Y/n): ").strip().lower()
         if open_page not in ['n', 'no']:
-            webbrowser.open(token_urls[platform])
+            # Looked up at call time so webbrowser.open stays patchable
+            (opener or webbrowser.open)(token_urls[platform])
             info(f"✅ Opened {platform.title()} token page in browser")
         
         # Get token from user
-        token = input(f"📋 Paste your {platform.title()} token: ").strip()
+        token = input_fn(f"📋 Paste your {platform.title()} token: ").strip()
         
         if not token:
             error("❌ No token provided")
             return False
         
         # Save token
-        token_file = Path(f'.deployx_{platform}_token')
+        token_file = TOKEN_FILES[platform]
         try:
             with open(token_file, 'w') as f:
                 f.write(token)
@@ -254,16 +263,14 @@ def _test_platform_token(platform: str, token: str) -> bool:
         
         elif platform == "netlify":
             # Test Netlify token by calling user API
-            import requests
             headers = {"Authorization": f"Bearer {token}"}
-            response = requests.get("https://api.netlify.com/api/v1/user", headers=headers)
+            response = get_session().get("https://api.netlify.com/api/v1/user", headers=headers)
             return response.status_code == 200
         
         elif platform == "render":
             # Test Render token by calling user API
-            import requests
             headers = {"Authorization": f"Bearer {token}"}
-            response = requests.get("https://api.render.com/v1/owners", headers=headers)
+            response = get_session().get("https://api.render.com/v1/owners", headers=headers)
             return response.status_code == 200
         
         return False
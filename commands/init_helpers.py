@@ -14,6 +14,7 @@ from git import Repo, InvalidGitRepositoryError
 from utils.ui import success, error, info
 from core.constants import (
     TOKEN_FILE_PERMISSIONS,
+    TOKEN_FILES,
 )
 
 
@@ -33,7 +34,7 @@ def save_token_to_file(project_path: str, platform: str, token: str) -> bool:
         True if successful, False otherwise
     """
     project_path_obj = Path(project_path)
-    token_filename = f".deployx_{platform}_token" if platform != "github" else ".deployx_token"
+    token_filename = str(TOKEN_FILES[platform])
     token_file = project_path_obj / token_filename
     
     try:
@@ -11,7 +11,7 @@ from typing import Dict, Any, Optional
 import questionary
 
 from utils.ui import success, error, info
-from core.constants import TOKEN_FILE_PERMISSIONS
+from core.constants import TOKEN_FILE_PERMISSIONS, TOKEN_FILES
 
 
 def configure_github(project_path: str, summary: Dict[str, Any], 
@@ -44,7 +44,7 @@ def configure_github(project_path: str, summary: Dict[str, Any],
         return None
     
     # Save token securely
-    if not _save_github_token(project_path, token_value):
+    if not _save_platform_token(project_path, "github", token_value):
         return None
     
     # Auto-detect or prompt for repository
@@ -366,41 +366,21 @@ def configure_render(project_path: str, summary: Dict[str, Any],
 
 # Helper functions
 
-def _save_github_token(project_path: str, token: str) -> bool:
-    """Save GitHub token to .deployx_token file."""
-    project_path_obj = Path(project_path)
-    token_file = project_path_obj / ".deployx_token"
-    
-    try:
-        with open(token_file, 'w') as f:
-            f.write(token)
-        # Set restrictive permissions (owner read/write only)
-        os.chmod(token_file, TOKEN_FILE_PERMISSIONS)
-        success("Token saved securely to .deployx_token")
-        
-        # Add to .gitignore
-        _add_to_gitignore(project_path_obj, ".deployx_token")
-        
-        return True
-        
-    except Exception as e:
-        error(f"Failed to save token: {str(e)}")
-        return False
-
-
 def _save_platform_token(project_path: str, platform: str, token: str) -> bool:
     """Save platform token to file."""
     project_path_obj = Path(project_path)
-    token_file = project_path_obj / f".deployx_{platform}_token"
+    token_filename = str(TOKEN_FILES[platform])
+    token_file = project_path_obj / token_filename
     
     try:
         with open(token_file, 'w') as f:
             f.write(token)
+        # Set restrictive permissions (owner read/write only)
         os.chmod(token_file, TOKEN_FILE_PERMISSIONS)
-        success(f"Token saved securely to .deployx_{platform}_token")
+        success(f"Token saved securely to {token_filename}")
         
         # Add to .gitignore
-        _add_to_gitignore(project_path_obj, f".deployx_{platform}_token")
+        _add_to_gitignore(project_path_obj, token_filename)
         
         return True
         
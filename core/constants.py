@@ -4,6 +4,7 @@ Global constants for DeployX.
 Centralizes configuration values, timeouts, and magic numbers
 used throughout the application.
 """
+from pathlib import Path
 
 # Build Configuration
 BUILD_TIMEOUT_SECONDS = 300  # 5 minutes max for build commands
@@ -36,6 +37,9 @@ RENDER_TOKEN_URL = "https://dashboard.render.com/account/api-keys"
 
 # Supported Values
 SUPPORTED_PLATFORMS = ["github", "vercel", "netlify", "railway", "render"]
+TOKEN_FILES = {
+    platform: Path(f"{TOKEN_FILE_PREFIX}_{platform}_token") for platform in SUPPORTED_PLATFORMS
+}  # Relative to the project directory
 SUPPORTED_PROJECT_TYPES = [
     "react", "vue", "static", "nextjs", "python", 
     "django", "flask", "fastapi", "nodejs", "angular", "vite"
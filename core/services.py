@@ -17,6 +17,7 @@ non-blocking operations where appropriate.
 import asyncio
 from pathlib import Path
 from typing import Optional, Tuple
+from .constants import TOKEN_FILES
 from .logging import get_logger
 from .models import DeployXConfig
 from utils.config import Config
@@ -132,11 +133,11 @@ class DeploymentService:
                                 os.environ[f'{config.platform.upper()}_TOKEN'] = token
                                 
                                 # Save token to .deployx_*_token file
-                                token_file = self.project_path / f'.deployx_{platform_name}_token'
+                                token_file = self.project_path / TOKEN_FILES[platform_name]
                                 try:
                                     with open(token_file, 'w') as f:
                                         f.write(token)
-                                    print(f"✅ Token saved to .deployx_{platform_name}_token")
+                                    print(f"✅ Token saved to {TOKEN_FILES[platform_name]}")
                                 except Exception as e:
                                     print(f"⚠️ Could not save token file: {e}")
                                 
@@ -0,0 +1,57 @@
+"""
+Shared HTTP session for platform API integrations.
+"""
+import atexit
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Keep-alive pool size per host. Uploads fan out to dozens of parallel
+# requests and a single run may deploy to several platforms, so allow well
+# beyond urllib3's default of 10 connections per host.
+POOL_SIZE = 64
+
+# Bytes read from a streamed request body per socket send. urllib3's 16KB
+# default means thousands of read/send round trips for a large upload.
+SEND_BLOCK_SIZE = 256 * 1024
+
+_session: Optional[requests.Session] = None
+_lock = threading.Lock()
+
+class _StreamingAdapter(HTTPAdapter):
+    """HTTPAdapter whose connections stream request bodies in large blocks."""
+    
+    def init_poolmanager(self, *args, **pool_kwargs):
+        pool_kwargs.setdefault('blocksize', SEND_BLOCK_SIZE)
+        super().init_poolmanager(*args, **pool_kwargs)
+
+def get_session() -> requests.Session:
+    """
+    Return the process-wide HTTP session, creating it on first use.
+    
+    All API integrations share one connection pool, so deploying to several
+    platforms in a run reuses TLS connections. Credentials are per request,
+    not stored on the session.
+    """
+    global _session
+    
+    if _session is None:
+        with _lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = _StreamingAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=0)
+                session.mount('https://', adapter)
+                _session = session
+    return _session
+
+@atexit.register
+def close_session() -> None:
+    """Close the shared session and release its pooled connections."""
+    global _session
+    
+    with _lock:
+        if _session is not None:
+            _session.close()
+            _session = None
@@ -0,0 +1,43 @@
+"""
+Timeout-bounded subprocess runner for platform CLI integrations.
+"""
+import os
+import signal
+import subprocess
+from typing import AnyStr, List, Optional
+
+def run_cli(args: List[str], timeout: float, input: Optional[AnyStr] = None, capture_output: bool = False,
+            check: bool = False, **kwargs) -> subprocess.CompletedProcess:
+    """
+    Run a CLI command like subprocess.run, killing its whole process group on timeout.
+    
+    Accepts the same `input`, `capture_output` and `check` arguments as
+    subprocess.run; everything else goes to Popen. The command runs in its
+    own session, so a timeout also stops the node workers that `vercel` and
+    `railway` spawn instead of leaving them orphaned. TimeoutExpired is
+    re-raised with any output read so far.
+    """
+    if input is not None:
+        kwargs['stdin'] = subprocess.PIPE
+    if capture_output:
+        kwargs['stdout'] = subprocess.PIPE
+        kwargs['stderr'] = subprocess.PIPE
+    
+    with subprocess.Popen(args, start_new_session=True, **kwargs) as process:
+        try:
+            stdout, stderr = process.communicate(input=input, timeout=timeout)
+        except subprocess.TimeoutExpired:
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+            except (AttributeError, ProcessLookupError):
+                # No process groups on Windows; fall back to the direct child
+                process.kill()
+            process.wait()
+            raise
+        except BaseException:
+            process.kill()
+            raise
+    
+    if check and process.returncode:
+        raise subprocess.CalledProcessError(process.returncode, args, output=stdout, stderr=stderr)
+    return subprocess.CompletedProcess(args, process.returncode, stdout, stderr)
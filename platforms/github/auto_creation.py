@@ -1,13 +1,17 @@
 """
 GitHub repository auto-creation functionality.
 """
-from typing import Tuple, Optional
+import re
+from typing import Callable, Tuple, Optional
 from github import Github, GithubException
 
 from core.logging import get_logger
 from utils.errors import handle_github_api_error
 from .git_utils import GitUtils
 
+# Runs of characters that cannot appear in a suggested repository name
+_SLUG_RE = re.compile(r'[^a-z0-9]+')
+
 class GitHubAutoCreation:
     """Handles automatic GitHub repository creation and setup."""
     
@@ -90,17 +94,15 @@ class GitHubAutoCreation:
     
     def _generate_suggested_name(self, project_name: str) -> str:
         """Generate a suggested repository name from project folder."""
-        base_name = project_name.lower().replace(" ", "-").replace("_", "-")
-        # Remove invalid characters and clean up
-        base_name = "".join(c for c in base_name if c.isalnum() or c == "-")
-        base_name = base_name.strip("-")
+        base_name = _SLUG_RE.sub("-", project_name.lower()).strip("-")
         return base_name or "my-project"
     
-    def _prompt_for_repo_name(self, suggested_name: str) -> Optional[str]:
+    def _prompt_for_repo_name(self, suggested_name: str,
+                              input_fn: Callable[[str], str] = input) -> Optional[str]:
         """Prompt user for repository name with suggestion."""
         try:
             print(f"\n📁 Repository name: {suggested_name}")
-            user_input = input("   Use default (press Enter) or enter custom name: ").strip()
+            user_input = input_fn("   Use default (press Enter) or enter custom name: ").strip()
             
             if not user_input:
                 return suggested_name
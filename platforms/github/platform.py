@@ -2,11 +2,11 @@
 GitHub Pages deployment platform implementation.
 """
 import os
-from pathlib import Path
 from typing import Dict, Any, Optional, Tuple
 from github import Github, GithubException
 import requests
 
+from core.constants import TOKEN_FILES
 from utils.errors import retry_with_backoff, handle_auth_error, handle_github_api_error
 from ..base import BasePlatform, DeploymentResult, DeploymentStatus
 from ..env_interface import PlatformEnvInterface
@@ -78,7 +78,7 @@ class GitHubPlatform(BasePlatform, PlatformEnvInterface):
         
         # Try .deployx_github_token file
         try:
-            token_file = Path('.deployx_github_token')
+            token_file = TOKEN_FILES['github']
             if token_file.exists():
                 token = token_file.read_text().strip()
                 if token:
@@ -3,16 +3,30 @@ Netlify API integration for direct deployment without CLI dependency.
 """
 import os
 import requests
+import threading
 import zipfile
-import tempfile
 from pathlib import Path
 from typing import Dict, Optional, Tuple, List
 from core.logging import get_logger
+from .._http import get_session
+from utils.errors import request_with_backoff
+
+# Deflate level for text assets in deploy archives. Already-compressed
+# formats are stored as-is, which leaves the CPU budget for gzip's default
+# level on the HTML, JS and CSS that actually shrink.
+ZIP_COMPRESS_LEVEL = 6
+
+# Formats that are compressed already and would only burn CPU in deflate
+PRECOMPRESSED_SUFFIXES = frozenset({
+    '.png', '.jpg', '.jpeg', '.gif', '.webp', '.avif',
+    '.woff', '.woff2', '.gz', '.br', '.zip',
+    '.mp3', '.mp4', '.webm', '.pdf'
+})
 
 class NetlifyAPIIntegration:
     """Direct Netlify API integration for site creation and deployment."""
     
-    def __init__(self, token: str):
+    def __init__(self, token: str, session: Optional[requests.Session] = None):
         self.token = token
         self.api_base = "https://api.netlify.com/api/v1"
         self.logger = get_logger(__name__)
@@ -20,11 +34,18 @@ class NetlifyAPIIntegration:
             "Authorization": f"Bearer {token}",
             "Content-Type": "application/json"
         }
+        
+        self.session = session or get_session()
+    
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request on the pooled session, retrying transient failures."""
+        kwargs['headers'] = {**self.headers, **kwargs.get('headers', {})}
+        return request_with_backoff(self.session, method, url, **kwargs)
     
     def validate_token(self) -> Tuple[bool, str, Optional[Dict]]:
         """Validate Netlify token and get user info."""
         try:
-            response = requests.get(f"{self.api_base}/user", headers=self.headers)
+            response = self._request('GET', f"{self.api_base}/user")
             
             if response.status_code == 200:
                 user_data = response.json()
@@ -48,11 +69,7 @@ class NetlifyAPIIntegration:
             if custom_domain:
                 payload["custom_domain"] = custom_domain
             
-            response = requests.post(
-                f"{self.api_base}/sites",
-                headers=self.headers,
-                json=payload
-            )
+            response = self._request('POST', f"{self.api_base}/sites", json=payload)
             
             if response.status_code == 201:
                 site_data = response.json()
@@ -74,32 +91,44 @@ class NetlifyAPIIntegration:
             if not build_path.exists():
                 return False, f"Build directory not found: {build_path}", None
             
-            # Create zip file of build directory
-            zip_path = self._create_deployment_zip(build_path)
+            # Zip the build in a background thread and stream the archive
+            # straight into the request body instead of staging it on disk
+            read_fd, write_fd = os.pipe()
+            archive_errors = []
+            writer = threading.Thread(
+                target=self._write_deployment_zip,
+                args=(build_path, write_fd, archive_errors),
+                daemon=True
+            )
+            writer.start()
             
             try:
-                # Upload zip file
-                with open(zip_path, 'rb') as zip_file:
-                    files = {'file': zip_file}
-                    headers = {"Authorization": f"Bearer {self.token}"}
+                with open(read_fd, 'rb') as zip_stream:
+                    headers = {
+                        "Authorization": f"Bearer {self.token}",
+                        "Content-Type": "application/zip"
+                    }
                     
-                    response = requests.post(
+                    # The archive is streamed from a pipe and cannot be
+                    # replayed, so the upload is sent once without retries
+                    response = self.session.post(
                         f"{self.api_base}/sites/{site_id}/deploys",
                         headers=headers,
-                        files=files
+                        data=zip_stream
                     )
-                
-                if response.status_code == 200:
-                    deploy_data = response.json()
-                    deploy_url = deploy_data.get('url')
-                    return True, "Deployment successful", deploy_url
-                else:
-                    error_msg = response.json().get('message', 'Deployment failed')
-                    return False, error_msg, None
-                    
             finally:
-                # Clean up zip file
-                os.unlink(zip_path)
+                writer.join()
+            
+            if archive_errors:
+                return False, f"Failed to archive build: {archive_errors[0]}", None
+            
+            if response.status_code == 200:
+                deploy_data = response.json()
+                deploy_url = deploy_data.get('url')
+                return True, "Deployment successful", deploy_url
+            else:
+                error_msg = response.json().get('message', 'Deployment failed')
+                return False, error_msg, None
                 
         except Exception as e:
             return False, f"Deployment error: {str(e)}", None
@@ -107,10 +136,7 @@ class NetlifyAPIIntegration:
     def get_site_info(self, site_id: str) -> Tuple[bool, Optional[Dict], str]:
         """Get site information."""
         try:
-            response = requests.get(
-                f"{self.api_base}/sites/{site_id}",
-                headers=self.headers
-            )
+            response = self._request('GET', f"{self.api_base}/sites/{site_id}")
             
             if response.status_code == 200:
                 site_data = response.json()
@@ -126,7 +152,7 @@ class NetlifyAPIIntegration:
     def list_sites(self) -> Tuple[bool, List[Dict], str]:
         """List all user sites."""
         try:
-            response = requests.get(f"{self.api_base}/sites", headers=self.headers)
+            response = self._request('GET', f"{self.api_base}/sites")
             
             if response.status_code == 200:
                 sites = response.json()
@@ -140,9 +166,9 @@ class NetlifyAPIIntegration:
     def get_deployment_status(self, site_id: str) -> Tuple[bool, str, Optional[str]]:
         """Get latest deployment status for a site."""
         try:
-            response = requests.get(
+            response = self._request(
+                'GET',
                 f"{self.api_base}/sites/{site_id}/deploys",
-                headers=self.headers,
                 params={"per_page": 1}
             )
             
@@ -161,16 +187,18 @@ class NetlifyAPIIntegration:
         except Exception:
             return False, "error", None
     
-    def _create_deployment_zip(self, build_path: Path) -> str:
-        """Create a zip file of the build directory."""
-        with tempfile.NamedTemporaryFile(suffix='.zip', delete=False) as tmp_file:
-            zip_path = tmp_file.name
-        
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-            for file_path in build_path.rglob('*'):
-                if file_path.is_file():
-                    # Get relative path from build directory
-                    relative_path = file_path.relative_to(build_path)
-                    zip_file.write(file_path, relative_path)
-        
-        return zip_path
+    def _write_deployment_zip(self, build_path: Path, write_fd: int, errors: List[Exception]) -> None:
+        """Write a zip of the build directory to a pipe, recording any failure."""
+        try:
+            with open(write_fd, 'wb') as pipe:
+                with zipfile.ZipFile(pipe, 'w', zipfile.ZIP_DEFLATED, compresslevel=ZIP_COMPRESS_LEVEL) as zip_file:
+                    for file_path in build_path.rglob('*'):
+                        if file_path.is_file():
+                            # Get relative path from build directory
+                            relative_path = file_path.relative_to(build_path)
+                            if file_path.suffix.lower() in PRECOMPRESSED_SUFFIXES:
+                                zip_file.write(file_path, relative_path, compress_type=zipfile.ZIP_STORED)
+                            else:
+                                zip_file.write(file_path, relative_path)
+        except Exception as e:
+            errors.append(e)
@@ -1,12 +1,16 @@
 """
 Netlify site auto-creation functionality.
 """
+import re
 from typing import Tuple, Optional
 from pathlib import Path
 from core.logging import get_logger
 from .api_integration import NetlifyAPIIntegration
 from .cli_integration import NetlifyCLIIntegration
 
+# Netlify site names allow only lowercase alphanumerics and hyphens
+_SLUG_RE = re.compile(r'[^a-z0-9]+')
+
 class NetlifyAutoCreation:
     """Handles automatic Netlify site creation and setup."""
     
@@ -80,12 +84,7 @@ class NetlifyAutoCreation:
     
     def _generate_suggested_name(self, site_name: str) -> str:
         """Generate a suggested site name."""
-        # Clean up site name for Netlify
-        suggested = site_name.lower().replace(" ", "-").replace("_", "-")
-        # Remove invalid characters (Netlify allows alphanumeric and hyphens)
-        suggested = "".join(c for c in suggested if c.isalnum() or c == "-")
-        # Remove leading/trailing hyphens
-        suggested = suggested.strip("-")
+        suggested = _SLUG_RE.sub("-", site_name.lower()).strip("-")
         return suggested or "my-site"
     
     def _prompt_for_site_name(self, suggested_name: str) -> Optional[str]:
@@ -5,6 +5,7 @@ import os
 from pathlib import Path
 from typing import Dict, Any, Optional, Tuple
 
+from core.constants import TOKEN_FILES
 from utils.errors import retry_with_backoff, handle_auth_error
 from ..base import BasePlatform, DeploymentResult, DeploymentStatus
 from .cli_integration import NetlifyCLIIntegration
@@ -45,7 +46,7 @@ class NetlifyPlatform(BasePlatform):
         
         # Try .deployx_netlify_token file
         try:
-            token_file = Path('.deployx_netlify_token')
+            token_file = TOKEN_FILES['netlify']
             if token_file.exists():
                 token = token_file.read_text().strip()
                 if token:
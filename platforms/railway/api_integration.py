@@ -4,11 +4,13 @@ Railway GraphQL API integration for complete auto-setup.
 import requests
 from typing import Dict, Optional, Tuple, List
 from core.logging import get_logger
+from .._http import get_session
+from utils.errors import request_with_backoff
 
 class RailwayAPIIntegration:
     """Railway GraphQL API integration for projects, services, and deployments."""
     
-    def __init__(self, token: str):
+    def __init__(self, token: str, session: Optional[requests.Session] = None):
         self.token = token
         self.api_base = "https://backboard.railway.app/graphql"
         self.logger = get_logger(__name__)
@@ -16,31 +18,56 @@ class RailwayAPIIntegration:
             "Authorization": f"Bearer {token}",
             "Content-Type": "application/json"
         }
+        
+        self.session = session or get_session()
+    
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send a request on the pooled session, retrying transient failures.
+        
+        Every GraphQL call is a POST, so read-only queries pass
+        idempotent=True to be retried like GETs; mutations are not resent
+        once the server may have acted on them.
+        """
+        kwargs['headers'] = {**self.headers, **kwargs.get('headers', {})}
+        return request_with_backoff(self.session, method, url, **kwargs)
     
     def validate_token(self) -> Tuple[bool, str, Optional[Dict]]:
         """Validate Railway token and get user info."""
+        valid, message, user_data, _ = self.check_token()
+        return valid, message, user_data
+    
+    def check_token(self) -> Tuple[bool, str, Optional[Dict], bool]:
+        """
+        Validate Railway token, also reporting whether Railway rejected it.
+        
+        The last element is True only when the API answered and refused the
+        token (401/403, a GraphQL error or no user for the `me` query), as
+        opposed to a network or server failure.
+        """
         try:
             query = {
                 "query": "query { me { id email } }"
             }
             
-            response = requests.post(self.api_base, headers=self.headers, json=query)
+            response = self._request('post', self.api_base, json=query, idempotent=True)
             
             if response.status_code == 200:
                 data = response.json()
                 if 'errors' in data:
-                    return False, f"Authentication failed: {data['errors'][0]['message']}", None
+                    return False, f"Authentication failed: {data['errors'][0]['message']}", None, True
                 
                 user_data = data.get('data', {}).get('me')
                 if user_data:
-                    return True, f"Authenticated as {user_data.get('email')}", user_data
+                    return True, f"Authenticated as {user_data.get('email')}", user_data, False
                 else:
-                    return False, "Invalid token", None
+                    return False, "Invalid token", None, True
             else:
-                return False, f"API error: {response.status_code}", None
+                rejected = response.status_code in (401, 403)
+                return False, f"API error: {response.status_code}", None, rejected
                 
         except Exception as e:
-            return False, f"Connection error: {str(e)}", None
+            return False, f"Connection error: {str(e)}", None, False
     
     def create_project(self, project_name: str, description: str = "") -> Tuple[bool, str, Optional[str]]:
         """Create a new Railway project."""
@@ -63,7 +90,7 @@ class RailwayAPIIntegration:
                 }
             }
             
-            response = requests.post(self.api_base, headers=self.headers, json=query)
+            response = self._request('post', self.api_base, json=query)
             
             if response.status_code == 200:
                 data = response.json()
@@ -109,7 +136,7 @@ class RailwayAPIIntegration:
                 }
             }
             
-            response = requests.post(self.api_base, headers=self.headers, json=query)
+            response = self._request('post', self.api_base, json=query)
             
             if response.status_code == 200:
                 data = response.json()
@@ -149,7 +176,7 @@ class RailwayAPIIntegration:
                 }
             }
             
-            response = requests.post(self.api_base, headers=self.headers, json=query)
+            response = self._request('post', self.api_base, json=query)
             
             if response.status_code == 200:
                 data = response.json()
@@ -201,7 +228,7 @@ class RailwayAPIIntegration:
                 "variables": {"id": project_id}
             }
             
-            response = requests.post(self.api_base, headers=self.headers, json=query)
+            response = self._request('post', self.api_base, json=query, idempotent=True)
             
             if response.status_code == 200:
                 data = response.json()
@@ -238,7 +265,7 @@ class RailwayAPIIntegration:
                 """
             }
             
-            response = requests.post(self.api_base, headers=self.headers, json=query)
+            response = self._request('post', self.api_base, json=query, idempotent=True)
             
             if response.status_code == 200:
                 data = response.json()
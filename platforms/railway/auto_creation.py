@@ -1,12 +1,18 @@
 """
 Railway project and service auto-creation functionality.
 """
-from typing import Tuple, Optional, Dict
-from pathlib import Path
+import functools
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Tuple, Optional, Dict, Set
 from core.logging import get_logger
 from .api_integration import RailwayAPIIntegration
 from .cli_integration import RailwayCLIIntegration
 
+# Railway project names allow only lowercase alphanumerics and hyphens
+_SLUG_RE = re.compile(r'[^a-z0-9]+')
+
 class RailwayAutoCreation:
     """Handles automatic Railway project and service creation."""
     
@@ -30,14 +36,19 @@ class RailwayAutoCreation:
         Returns:
             Tuple of (should_create, reason)
         """
+        # Read the directory once instead of stat-ing each marker
+        try:
+            with os.scandir(project_path) as entries:
+                names = {entry.name for entry in entries}
+        except OSError:
+            names = set()
+        
         # Check for existing Railway configuration
-        railway_config = Path(project_path) / '.railway'
-        if railway_config.exists():
+        if '.railway' in names:
             return False, "Railway project already configured"
         
         # Check for railway.json
-        railway_json = Path(project_path) / 'railway.json'
-        if railway_json.exists():
+        if 'railway.json' in names:
             return False, "railway.json found, project may already exist"
         
         return True, "No Railway project detected"
@@ -56,28 +67,40 @@ class RailwayAutoCreation:
                 self.logger.info(f"Skipping project creation: {reason}")
                 return True, reason, None
             
-            # Get project and service names
-            final_project_name = self._prompt_for_project_name(project_name)
+            # Snapshot existing projects in the background while the user
+            # picks a name, so the lookup costs no extra wall time
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                existing_future = executor.submit(self._list_project_ids)
+                final_project_name = self._prompt_for_project_name(project_name)
+                existing_ids = existing_future.result()
+            
             if not final_project_name:
                 return False, "Project creation cancelled", None
             
             final_service_name = service_name or f"{final_project_name}-service"
             
             # Create project
-            project_success, project_message, project_id = self._create_project(final_project_name)
+            project_success, project_message, project_id = self._create_project(
+                final_project_name, existing_ids
+            )
             if not project_success:
                 return False, f"Project creation failed: {project_message}", None
             
-            # Create service
-            service_success, service_message, service_id = self._create_service(
-                project_id, final_service_name
-            )
+            # Create service and look up the environment concurrently;
+            # both only depend on the project ID
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                service_future = executor.submit(
+                    self._create_service, project_id, final_service_name
+                )
+                environment_future = executor.submit(
+                    self._get_production_environment, project_id
+                )
+                service_success, service_message, service_id = service_future.result()
+                environment_id = environment_future.result()
+            
             if not service_success:
                 return False, f"Service creation failed: {service_message}", None
             
-            # Get environment info
-            environment_id = self._get_production_environment(project_id)
-            
             setup_info = {
                 "project_id": project_id,
                 "project_name": final_project_name,
@@ -109,29 +132,37 @@ class RailwayAutoCreation:
             print("\n❌ Project creation cancelled")
             return None
     
-    def _generate_suggested_name(self, project_name: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _generate_suggested_name(project_name: str) -> str:
         """Generate a clean project name."""
-        # Clean up project name for Railway
-        suggested = project_name.lower().replace(" ", "-").replace("_", "-")
-        # Remove invalid characters (Railway allows alphanumeric and hyphens)
-        suggested = "".join(c for c in suggested if c.isalnum() or c == "-")
-        # Remove leading/trailing hyphens
-        suggested = suggested.strip("-")
+        suggested = _SLUG_RE.sub("-", project_name.lower()).strip("-")
         return suggested or "my-project"
     
-    def _create_project(self, project_name: str) -> Tuple[bool, str, Optional[str]]:
+    def _list_project_ids(self) -> Set[str]:
+        """Return the IDs of the user's existing projects."""
+        if self.api_integration:
+            success, projects, _ = self.api_integration.list_projects()
+            if success:
+                return {project.get('id') for project in projects}
+        return set()
+    
+    def _create_project(self, project_name: str, existing_ids: Optional[Set[str]] = None) -> Tuple[bool, str, Optional[str]]:
         """Create Railway project using available method."""
+        existing_ids = existing_ids or set()
+        
         # Try CLI first if available
         if self.use_cli and self.cli_integration.is_cli_available():
             success, message = self.cli_integration.create_project(project_name)
             if success:
                 # CLI doesn't return project ID directly, we'll need to get it via API
                 if self.api_integration:
-                    # List projects to find the newly created one
+                    # List projects to find the newly created one, skipping
+                    # older projects that happen to share its name
                     list_success, projects, _ = self.api_integration.list_projects()
                     if list_success:
                         for project in projects:
-                            if project.get('name') == project_name:
+                            if project.get('name') == project_name and project.get('id') not in existing_ids:
                                 return True, message, project.get('id')
                 return True, message, None
             else:
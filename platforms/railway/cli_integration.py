@@ -3,51 +3,91 @@ Railway CLI integration for authentication and operations.
 """
 import subprocess
 import json
+import time
+import re
 from typing import Optional, Tuple, Dict, Any
 from pathlib import Path
 from core.logging import get_logger
+from .._process import run_cli
+
+# Seconds a `whoami` probe result is reused before asking the CLI again
+PROBE_TTL = 60.0
+
+# Seconds to wait for quick CLI commands (whoami, status, linking) and for
+# deployments before giving up on a hung `railway` process
+COMMAND_TIMEOUT = 30
+DEPLOY_TIMEOUT = 600
+
+_URL_RE = re.compile(r'https://\S*railway\.app\S*')
+
+# Parsed token from ~/.railway/config.json, reused until the file changes
+_TOKEN_CACHE: Dict[str, Any] = {'path': None, 'mtime': 0, 'token': None}
 
 class RailwayCLIIntegration:
     """Integration with Railway CLI for authentication and operations."""
     
     def __init__(self):
         self.logger = get_logger(__name__)
+        self._cli_available: Optional[bool] = None
+        self._cli_user: Optional[str] = None
+        self._probe_ts = 0.0
     
-    def is_cli_available(self) -> bool:
-        """Check if Railway CLI is installed and authenticated."""
+    def _probe(self) -> Tuple[bool, Optional[str]]:
+        """Run `railway whoami`, reusing the result for PROBE_TTL seconds."""
+        if self._cli_available is not None and time.monotonic() - self._probe_ts < PROBE_TTL:
+            return self._cli_available, self._cli_user
+        
         try:
-            result = subprocess.run(
+            result = run_cli(
                 ["railway", "whoami"],
                 capture_output=True,
-                text=True
+                text=True,
+                timeout=COMMAND_TIMEOUT
             )
-            return result.returncode == 0
+            available = result.returncode == 0
+            user = result.stdout.strip() if available else None
         except FileNotFoundError:
-            return False
+            available, user = False, None
+        except subprocess.TimeoutExpired:
+            self.logger.warning(f"Railway CLI did not answer whoami within {COMMAND_TIMEOUT}s")
+            return False, None
+        except Exception as e:
+            self.logger.error(f"Failed to get authenticated user: {e}")
+            return False, None
+        
+        self._cli_available, self._cli_user = available, user
+        self._probe_ts = time.monotonic()
+        return available, user
+    
+    def is_cli_available(self) -> bool:
+        """Check if Railway CLI is installed and authenticated."""
+        available, _ = self._probe()
+        return available
     
     def get_authenticated_user(self) -> Optional[str]:
         """Get the authenticated Railway username."""
-        try:
-            result = subprocess.run(
-                ["railway", "whoami"],
-                capture_output=True,
-                text=True
-            )
-            if result.returncode == 0:
-                return result.stdout.strip()
-        except Exception as e:
-            self.logger.error(f"Failed to get authenticated user: {e}")
-        return None
+        _, user = self._probe()
+        return user
     
     def get_token(self) -> Optional[str]:
         """Get Railway token from CLI config."""
         try:
             # Try to get token from Railway CLI config
             config_path = Path.home() / '.railway' / 'config.json'
-            if config_path.exists():
-                with open(config_path, 'r') as f:
-                    config_data = json.load(f)
-                    return config_data.get('token')
+            try:
+                mtime = config_path.stat().st_mtime_ns
+            except FileNotFoundError:
+                return None
+            
+            # Skip the read and JSON decode when the config is unchanged
+            if _TOKEN_CACHE['path'] == config_path and _TOKEN_CACHE['mtime'] == mtime:
+                return _TOKEN_CACHE['token']
+            
+            with open(config_path, 'r') as f:
+                config_data = json.load(f)
+            token = config_data.get('token')
+            _TOKEN_CACHE.update(path=config_path, mtime=mtime, token=token)
+            return token
         except Exception as e:
             self.logger.error(f"Failed to get token: {str(e)}")
         return None
@@ -55,10 +95,11 @@ class RailwayCLIIntegration:
     def login(self) -> Tuple[bool, str]:
         """Login using Railway CLI."""
         try:
-            result = subprocess.run(
+            result = run_cli(
                 ["railway", "login"],
                 capture_output=True,
-                text=True
+                text=True,
+                timeout=DEPLOY_TIMEOUT
             )
             
             if result.returncode == 0:
@@ -66,17 +107,20 @@ class RailwayCLIIntegration:
             else:
                 return False, f"Login failed: {result.stderr}"
                 
+        except subprocess.TimeoutExpired:
+            return False, f"Login timed out after {DEPLOY_TIMEOUT}s"
         except Exception as e:
             return False, f"Login error: {str(e)}"
     
     def create_project(self, project_name: str, project_path: str = ".") -> Tuple[bool, str]:
         """Create a Railway project using CLI."""
         try:
-            result = subprocess.run(
+            result = run_cli(
                 ["railway", "new", project_name],
                 cwd=project_path,
                 capture_output=True,
                 text=True,
+                timeout=DEPLOY_TIMEOUT,
                 input="y\n"  # Confirm project creation
             )
             
@@ -86,17 +130,20 @@ class RailwayCLIIntegration:
             else:
                 return False, f"Failed to create project: {result.stderr}"
                 
+        except subprocess.TimeoutExpired:
+            return False, f"Project creation timed out after {DEPLOY_TIMEOUT}s"
         except Exception as e:
             return False, f"Failed to create project: {str(e)}"
     
     def link_project(self, project_id: str, project_path: str = ".") -> Tuple[bool, str]:
         """Link current directory to a Railway project."""
         try:
-            result = subprocess.run(
+            result = run_cli(
                 ["railway", "link", project_id],
                 cwd=project_path,
                 capture_output=True,
-                text=True
+                text=True,
+                timeout=COMMAND_TIMEOUT
             )
             
             if result.returncode == 0:
@@ -104,43 +151,48 @@ class RailwayCLIIntegration:
             else:
                 return False, f"Failed to link project: {result.stderr}"
                 
+        except subprocess.TimeoutExpired:
+            return False, f"Linking timed out after {COMMAND_TIMEOUT}s"
         except Exception as e:
             return False, f"Link error: {str(e)}"
     
     def deploy_project(self, project_path: str = ".") -> Tuple[bool, str, Optional[str]]:
         """Deploy project using Railway CLI."""
         try:
-            result = subprocess.run(
+            result = run_cli(
                 ["railway", "up"],
                 cwd=project_path,
                 capture_output=True,
-                text=True
+                text=True,
+                timeout=DEPLOY_TIMEOUT
             )
             
             if result.returncode == 0:
                 # Extract URL from output if available
-                lines = result.stdout.strip().split('\n')
-                url = None
-                for line in lines:
-                    if 'https://' in line and 'railway.app' in line:
-                        url = line.strip()
-                        break
+                match = _URL_RE.search(result.stdout)
+                url = match.group(0) if match else None
                 
                 return True, "Deployment successful", url
             else:
                 return False, f"Deployment failed: {result.stderr}", None
                 
+        except subprocess.TimeoutExpired as e:
+            # Keep whatever the CLI printed before it was killed
+            if e.stdout:
+                self.logger.error(f"Partial deploy output: {e.stdout}")
+            return False, f"Deployment timed out after {DEPLOY_TIMEOUT}s", None
         except Exception as e:
             return False, f"Deployment failed: {str(e)}", None
     
     def get_project_info(self, project_path: str = ".") -> Optional[Dict[str, Any]]:
         """Get current project information."""
         try:
-            result = subprocess.run(
+            result = run_cli(
                 ["railway", "status"],
                 cwd=project_path,
                 capture_output=True,
-                text=True
+                text=True,
+                timeout=COMMAND_TIMEOUT
             )
             if result.returncode == 0:
                 # Parse status output (Railway CLI doesn't provide JSON output)
@@ -152,11 +204,12 @@ class RailwayCLIIntegration:
     def set_environment_variable(self, key: str, value: str, project_path: str = ".") -> Tuple[bool, str]:
         """Set an environment variable."""
         try:
-            result = subprocess.run(
+            result = run_cli(
                 ["railway", "variables", "set", f"{key}={value}"],
                 cwd=project_path,
                 capture_output=True,
-                text=True
+                text=True,
+                timeout=COMMAND_TIMEOUT
             )
             
             if result.returncode == 0:
@@ -164,5 +217,7 @@ class RailwayCLIIntegration:
             else:
                 return False, f"Failed to set variable: {result.stderr}"
                 
+        except subprocess.TimeoutExpired:
+            return False, f"Setting variable timed out after {COMMAND_TIMEOUT}s"
         except Exception as e:
             return False, f"Variable error: {str(e)}"
@@ -2,15 +2,21 @@
 Railway deployment platform implementation with complete auto-setup.
 """
 import os
-from pathlib import Path
+import time
+from functools import cached_property
 from typing import Dict, Any, Optional, Tuple
 
+from core.constants import TOKEN_FILES
 from utils.errors import retry_with_backoff, handle_auth_error
 from ..base import BasePlatform, DeploymentResult, DeploymentStatus
 from .cli_integration import RailwayCLIIntegration
 from .api_integration import RailwayAPIIntegration
 from .auto_creation import RailwayAutoCreation
 
+# Seconds a resolved token is reused before the CLI, token file and
+# environment are probed again
+TOKEN_TTL = 300.0
+
 class RailwayPlatform(BasePlatform):
     """Railway deployment platform with complete auto-setup."""
     
@@ -30,13 +36,48 @@ class RailwayPlatform(BasePlatform):
         
         # Initialize components
         self.cli_integration = RailwayCLIIntegration()
+        self._token_cached: Optional[str] = None
+        self._token_fetched_at = 0.0
         
-        # Get token and initialize other components
+        # API and auto-creation components are built lazily from the token
         self.token = self._get_token()
-        self.api_integration = RailwayAPIIntegration(self.token) if self.token else None
-        self.auto_creation = RailwayAutoCreation(self.token, self.use_cli) if self.token else None
     
-    def _get_token(self) -> Optional[str]:
+    @cached_property
+    def api_integration(self) -> Optional[RailwayAPIIntegration]:
+        """Railway API client for the current token, created on first use."""
+        if not self.token:
+            return None
+        return RailwayAPIIntegration(self.token)
+    
+    @cached_property
+    def auto_creation(self) -> Optional[RailwayAutoCreation]:
+        """Auto-setup helper for the current token, created on first use."""
+        if not self.token:
+            return None
+        return RailwayAutoCreation(self.token, self.use_cli)
+    
+    @property
+    def token(self) -> Optional[str]:
+        """Railway token; assigning a different one drops components built for the old one."""
+        return self._token
+    
+    @token.setter
+    def token(self, token: Optional[str]) -> None:
+        if token != getattr(self, '_token', None):
+            self.__dict__.pop('api_integration', None)
+            self.__dict__.pop('auto_creation', None)
+        self._token = token
+    
+    def _get_token(self, force_refresh: bool = False) -> Optional[str]:
+        """Get Railway token, reusing a recent lookup unless force_refresh is set."""
+        if not force_refresh and self._token_cached and time.monotonic() - self._token_fetched_at < TOKEN_TTL:
+            return self._token_cached
+        
+        self._token_cached = self._resolve_token()
+        self._token_fetched_at = time.monotonic()
+        return self._token_cached
+    
+    def _resolve_token(self) -> Optional[str]:
         """Get Railway token from CLI, file, or environment."""
         # Try CLI integration first
         if self.cli_integration.is_cli_available():
@@ -46,7 +87,7 @@ class RailwayPlatform(BasePlatform):
         
         # Try .deployx_railway_token file
         try:
-            token_file = Path('.deployx_railway_token')
+            token_file = TOKEN_FILES['railway']
             if token_file.exists():
                 token = token_file.read_text().strip()
                 if token:
@@ -60,21 +101,21 @@ class RailwayPlatform(BasePlatform):
     @retry_with_backoff(max_retries=3)
     def validate_credentials(self) -> Tuple[bool, str]:
         """Validate Railway token and setup complete project if needed."""
-        # Refresh token (in case it was updated)
+        # Reuse the recently resolved token; it is refreshed after the TTL
         self.token = self._get_token()
         
         if not self.token:
             error = handle_auth_error("railway", "No token provided")
             return False, error.message
         
-        # Initialize components if not available
-        if not self.api_integration:
-            self.api_integration = RailwayAPIIntegration(self.token)
-        if not self.auto_creation:
-            self.auto_creation = RailwayAutoCreation(self.token, self.use_cli)
-        
         # Validate token
-        valid, message, user_data = self.api_integration.validate_token()
+        valid, message, user_data, rejected = self.api_integration.check_token()
+        if rejected:
+            # The cached token may have been rotated; look it up again once
+            token = self._get_token(force_refresh=True)
+            if token and token != self.token:
+                self.token = token
+                valid, message, user_data = self.api_integration.validate_token()
         if not valid:
             return False, message
         
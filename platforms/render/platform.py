@@ -11,6 +11,7 @@ from ..base import BasePlatform, DeploymentResult, DeploymentStatus
 from ..env_interface import PlatformEnvInterface
 from .api import RenderAPIClient
 from .detector import RenderServiceDetector
+from core.constants import TOKEN_FILES
 from utils.errors import AuthenticationError
 from utils.config import Config
 from core.logging import get_logger
@@ -30,7 +31,7 @@ class RenderPlatform(BasePlatform, PlatformEnvInterface):
         
     def _get_token(self) -> str:
         """Get Render token from file or environment."""
-        token_file = Path('.deployx_render_token')
+        token_file = TOKEN_FILES['render']
         
         if token_file.exists():
             try:
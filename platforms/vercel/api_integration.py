@@ -1,15 +1,163 @@
 """
 Vercel API integration for direct deployment without CLI dependency.
 """
+import base64
+import hashlib
+import json
+import os
+import random
+import time
 import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, Optional, Tuple, List
+from typing import Dict, Iterator, Optional, Tuple, List
+from core.constants import TOKEN_FILE_PREFIX
 from core.logging import get_logger
+from .._http import get_session
+from utils.errors import request_with_backoff
+from utils.gitignore import add_to_existing_gitignore
+
+# Maximum number of files uploaded in parallel. Uploads are bound by
+# round-trip latency rather than bandwidth, and the Vercel CLI settles on a
+# similar socket limit; keep this below the shared pool's POOL_SIZE.
+UPLOAD_CONCURRENCY = 50
+
+# (connect, read) timeouts in seconds for /v2/files uploads. The connect
+# value also bounds each stalled socket write while a body is streaming, so
+# a dead connection fails fast and the upload is retried on a fresh one.
+UPLOAD_TIMEOUT = (10, 120)
+
+# Threads computing SHA-1 digests; hashlib releases the GIL on large
+# buffers, so hashing scales with the available cores
+HASH_CONCURRENCY = os.cpu_count() or 4
+
+# Read size for hashing on Pythons without hashlib.file_digest (< 3.11)
+HASH_BLOCK_SIZE = 256 * 1024
+
+# Deployment states after which polling stops
+TERMINAL_STATES = {"READY", "ERROR", "CANCELED"}
+
+# Upper bound in seconds on the delay between two status polls
+POLL_MAX_DELAY = 10.0
+
+# Files up to this size are sent inline with the deployment request
+INLINE_FILE_LIMIT = 64 * 1024
+
+# Total raw bytes inlined into a single deployment request
+INLINE_BATCH_LIMIT = 3 * 1024 * 1024
+
+# Digests of files Vercel already accepted, kept in the project directory so
+# unchanged files are neither re-hashed nor re-uploaded on the next deploy
+UPLOAD_MANIFEST = ".deployx_upload_manifest.json"
+
+# Entries never uploaded, matching the Vercel CLI's default ignores. Other
+# dotfiles are kept since sites serve paths such as /.well-known/.
+IGNORED_NAMES = frozenset({
+    '.git', '.hg', '.svn', '.vercel', '.cache', '.venv', '.DS_Store',
+    'node_modules', '__pycache__'
+})
+
+# Name prefixes never uploaded: local secrets and DeployX's own token files
+IGNORED_PREFIXES = ('.env', TOKEN_FILE_PREFIX)
+
+def _error_body(response: requests.Response) -> Dict:
+    """Return the `error` object of a Vercel error response, or an empty dict."""
+    try:
+        body = response.json() if response.content else None
+    except ValueError:
+        # Proxies and gateways may answer with HTML or an empty body
+        return {}
+    error = body.get('error') if isinstance(body, dict) else None
+    return error if isinstance(error, dict) else {}
+
+def _extract_error(response: requests.Response, default: str) -> str:
+    """Return the `error.message` from a Vercel error response, or default."""
+    return _error_body(response).get('message') or default
+
+def _walk_files(root: str) -> Iterator[Tuple[str, os.stat_result]]:
+    """Yield (path, stat) for every file below root using a single scandir pass."""
+    with os.scandir(root) as entries:
+        for entry in entries:
+            # Prune ignored directories before descending into them
+            if entry.name in IGNORED_NAMES or entry.name.startswith(IGNORED_PREFIXES):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_files(entry.path)
+            elif entry.is_file():
+                yield entry.path, entry.stat()
+
+def _load_manifest(project_path: str, output_dir: str) -> Dict[str, List]:
+    """Return the {relative path: [mtime_ns, size, sha]} entries of the last deploy."""
+    try:
+        with open(os.path.join(project_path, UPLOAD_MANIFEST), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(manifest, dict) or manifest.get('output_dir') != output_dir:
+        return {}
+    files = manifest.get('files')
+    return files if isinstance(files, dict) else {}
+
+def _save_manifest(project_path: str, output_dir: str, files: Dict[str, List]) -> None:
+    """Atomically replace the upload manifest; failures only cost the cache."""
+    manifest_path = os.path.join(project_path, UPLOAD_MANIFEST)
+    tmp_path = f"{manifest_path}.{os.getpid()}.tmp"
+    first_write = not os.path.exists(manifest_path)
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'output_dir': output_dir, 'files': files}, f, separators=(',', ':'))
+        os.replace(tmp_path, manifest_path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        return
+    
+    if first_write:
+        # Keep the manifest out of the user's commits, like token and history files
+        try:
+            add_to_existing_gitignore(Path(project_path), UPLOAD_MANIFEST)
+        except OSError:
+            pass
+
+def _hash_file(file_path: str) -> Tuple[str, int]:
+    """Return the SHA-1 hex digest and size of a file."""
+    with open(file_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        # Hash through one reused buffer; unlike an mmap, a file truncated
+        # mid-read by a running build cannot fault the process
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, 'sha1').hexdigest(), size
+        
+        sha = hashlib.sha1()
+        buffer = bytearray(HASH_BLOCK_SIZE)
+        view = memoryview(buffer)
+        while True:
+            read = f.readinto(buffer)
+            if not read:
+                break
+            sha.update(view[:read])
+    return sha.hexdigest(), size
+
+def _relative_path(file_path: str, root: str) -> str:
+    """Return file_path relative to root in the POSIX form Vercel expects."""
+    return os.path.relpath(file_path, root).replace(os.sep, '/')
+
+def _inline_file(file_path: str, root: str) -> Dict:
+    """Build an inline base64 file descriptor for the deployment payload."""
+    with open(file_path, 'rb') as f:
+        data = f.read()
+    return {
+        "file": _relative_path(file_path, root),
+        "data": base64.b64encode(data).decode('ascii'),
+        "encoding": "base64"
+    }
 
 class VercelAPIIntegration:
     """Direct Vercel API integration for file upload and deployment."""
     
-    def __init__(self, token: str):
+    def __init__(self, token: str, session: Optional[requests.Session] = None):
         self.token = token
         self.api_base = "https://api.vercel.com"
         self.logger = get_logger(__name__)
@@ -17,6 +165,16 @@ class VercelAPIIntegration:
             "Authorization": f"Bearer {token}",
             "Content-Type": "application/json"
         }
+        
+        self.session = session or get_session()
+        # Files referenced from the upload manifest without re-uploading,
+        # by digest, in case Vercel has since expired them
+        self._skipped_uploads: Dict[str, Tuple[str, str, int]] = {}
+    
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request on the pooled session, retrying transient failures."""
+        kwargs['headers'] = {**self.headers, **kwargs.get('headers', {})}
+        return request_with_backoff(self.session, method, url, **kwargs)
     
     def create_project(self, project_name: str, framework: Optional[str] = None) -> Tuple[bool, str, Optional[str]]:
         """Create a new Vercel project via API."""
@@ -26,9 +184,9 @@ class VercelAPIIntegration:
                 "framework": framework
             }
             
-            response = requests.post(
+            response = self._request(
+                'post',
                 f"{self.api_base}/v9/projects",
-                headers=self.headers,
                 json=payload
             )
             
@@ -37,14 +195,23 @@ class VercelAPIIntegration:
                 project_id = project_data.get('id')
                 return True, f"Created project: {project_name}", project_id
             else:
-                error_msg = response.json().get('error', {}).get('message', 'Unknown error')
+                error_msg = _extract_error(response, 'Unknown error')
                 return False, f"Failed to create project: {error_msg}", None
                 
         except Exception as e:
             return False, f"API error: {str(e)}", None
     
     def upload_files(self, project_path: str, output_dir: str) -> Tuple[bool, str, Optional[List[Dict]]]:
-        """Upload project files to Vercel."""
+        """
+        Upload project files to Vercel.
+        
+        Files up to INLINE_FILE_LIMIT are embedded in the deployment payload,
+        smallest first, up to INLINE_BATCH_LIMIT bytes in total; the rest are
+        streamed from disk as raw bodies keyed by their SHA-1 digest. Files
+        whose mtime and size match the UPLOAD_MANIFEST entry from a previous
+        deploy are referenced by their recorded digest without being read.
+        Returns the file descriptors expected by create_deployment.
+        """
         try:
             files_data = []
             build_path = Path(project_path) / output_dir
@@ -52,37 +219,125 @@ class VercelAPIIntegration:
             if not build_path.exists():
                 return False, f"Build directory not found: {build_path}", None
             
-            # Collect all files
-            for file_path in build_path.rglob('*'):
-                if file_path.is_file():
-                    relative_path = file_path.relative_to(build_path)
+            root = str(build_path)
+            manifest = _load_manifest(project_path, output_dir)
+            uploaded = {}
+            mtimes = {}
+            self._skipped_uploads = {}
+            
+            # Small files ride along inline in the deployment request, which
+            # saves one round trip each; larger ones are uploaded separately.
+            # Digests are computed on their own pool and each file is queued
+            # for upload as soon as its digest is ready, so hashing later
+            # files overlaps the transfer of earlier ones.
+            errors = []
+            hash_futures = {}
+            inline_futures = {}
+            upload_futures = []
+            inline_budget = INLINE_BATCH_LIMIT
+            with ThreadPoolExecutor(max_workers=UPLOAD_CONCURRENCY) as uploaders:
+                def queue_upload(file_path: str):
+                    sha, size = _hash_file(file_path)
+                    return uploaders.submit(self._upload_file, file_path, root, sha, size)
+                
+                with ThreadPoolExecutor(max_workers=HASH_CONCURRENCY) as hashers:
+                    def submit(file_path: str, stat: os.stat_result):
+                        relative_path = _relative_path(file_path, root)
+                        entry = manifest.get(relative_path)
+                        if entry and entry[:2] == [stat.st_mtime_ns, stat.st_size]:
+                            sha = entry[2]
+                            self._skipped_uploads[sha] = (file_path, root, stat.st_size)
+                            files_data.append({"file": relative_path, "sha": sha, "size": stat.st_size})
+                            uploaded[relative_path] = entry
+                        else:
+                            mtimes[relative_path] = stat.st_mtime_ns
+                            hash_futures[hashers.submit(queue_upload, file_path)] = file_path
+                    
+                    small_files = []
+                    for file_path, stat in _walk_files(root):
+                        if stat.st_size <= INLINE_FILE_LIMIT:
+                            small_files.append((stat.st_size, file_path, stat))
+                        else:
+                            submit(file_path, stat)
+                    
+                    # Fill the inline budget smallest-first, which saves the
+                    # most upload requests per inlined byte
+                    small_files.sort(key=lambda item: item[:2])
+                    inline_files = []
+                    for size, file_path, stat in small_files:
+                        if size <= inline_budget:
+                            inline_files.append(file_path)
+                            inline_budget -= size
+                        else:
+                            submit(file_path, stat)
                     
-                    with open(file_path, 'rb') as f:
-                        file_content = f.read()
+                    # Read inline files only once every upload is queued, so
+                    # their disk reads never hold up the network-bound stage
+                    for file_path in inline_files:
+                        inline_futures[hashers.submit(_inline_file, file_path, root)] = file_path
+                
+                for future, file_path in inline_futures.items():
+                    try:
+                        files_data.append(future.result())
+                    except OSError as e:
+                        errors.append(f"Failed to read {_relative_path(file_path, root)}: {str(e)}")
+                
+                for future, file_path in hash_futures.items():
+                    try:
+                        upload_futures.append(future.result())
+                    except OSError as e:
+                        errors.append(f"Failed to read {_relative_path(file_path, root)}: {str(e)}")
+                
+                # Collect every failure instead of aborting the batch on the first one
+                for future in as_completed(upload_futures):
+                    try:
+                        success, message, descriptor = future.result()
+                    except Exception as e:
+                        success, message, descriptor = False, f"Upload error: {str(e)}", None
                     
-                    files_data.append({
-                        "file": str(relative_path),
-                        "data": file_content.hex()
-                    })
+                    if success:
+                        files_data.append(descriptor)
+                        uploaded[descriptor['file']] = [mtimes[descriptor['file']], descriptor['size'], descriptor['sha']]
+                    else:
+                        errors.append(message)
             
-            # Upload files
-            payload = {"files": files_data}
+            # Record what Vercel now holds, even if some uploads failed
+            if uploaded != manifest:
+                _save_manifest(project_path, output_dir, uploaded)
             
-            response = requests.post(
-                f"{self.api_base}/v2/files",
-                headers=self.headers,
-                json=payload
-            )
+            if errors:
+                return False, f"{len(errors)} of {len(hash_futures) + len(inline_futures)} files failed to upload: {'; '.join(errors)}", None
             
-            if response.status_code == 200:
-                return True, "Files uploaded successfully", files_data
-            else:
-                error_msg = response.json().get('error', {}).get('message', 'Upload failed')
-                return False, error_msg, None
+            return True, "Files uploaded successfully", files_data
                 
         except Exception as e:
             return False, f"Upload error: {str(e)}", None
     
+    def _upload_file(self, file_path: str, root: str, sha: str, size: int) -> Tuple[bool, str, Optional[Dict]]:
+        """Upload a single file under its precomputed digest and return its descriptor."""
+        relative_path = _relative_path(file_path, root)
+        
+        with open(file_path, 'rb') as f:
+            response = self._request(
+                'post',
+                f"{self.api_base}/v2/files",
+                data=f,
+                # Files are addressed by their SHA, so resending one is harmless
+                idempotent=True,
+                timeout=UPLOAD_TIMEOUT,
+                headers={
+                    "Content-Type": "application/octet-stream",
+                    "Content-Length": str(size),
+                    "x-vercel-digest": sha
+                }
+            )
+        
+        if response.status_code == 200:
+            return True, f"Uploaded {relative_path}", {"file": relative_path, "sha": sha, "size": size}
+        else:
+            error_msg = _extract_error(response, 'Upload failed')
+            return False, f"Failed to upload {relative_path}: {error_msg}", None
+    
     def create_deployment(self, project_name: str, files: List[Dict]) -> Tuple[bool, str, Optional[str]]:
         """Create a deployment with uploaded files."""
         try:
@@ -94,12 +349,32 @@ class VercelAPIIntegration:
                 }
             }
             
-            response = requests.post(
+            response = self._request(
+                'post',
                 f"{self.api_base}/v13/deployments",
-                headers=self.headers,
                 json=payload
             )
             
+            # Vercel expires unused uploads; restore any manifest-skipped
+            # files it no longer has and create the deployment again
+            missing = _error_body(response).get('missing') if response.status_code == 400 else None
+            if missing and all(sha in self._skipped_uploads for sha in missing):
+                def reupload(sha: str):
+                    file_path, root, size = self._skipped_uploads[sha]
+                    return self._upload_file(file_path, root, sha, size)
+                
+                with ThreadPoolExecutor(max_workers=UPLOAD_CONCURRENCY) as uploaders:
+                    results = list(uploaders.map(reupload, missing))
+                for success, message, _ in results:
+                    if not success:
+                        return False, message, None
+                
+                response = self._request(
+                    'post',
+                    f"{self.api_base}/v13/deployments",
+                    json=payload
+                )
+            
             if response.status_code in [200, 201]:
                 deployment_data = response.json()
                 deployment_url = deployment_data.get('url')
@@ -108,7 +383,7 @@ class VercelAPIIntegration:
                 
                 return True, "Deployment created successfully", deployment_url
             else:
-                error_msg = response.json().get('error', {}).get('message', 'Deployment failed')
+                error_msg = _extract_error(response, 'Deployment failed')
                 return False, error_msg, None
                 
         except Exception as e:
@@ -117,9 +392,9 @@ class VercelAPIIntegration:
     def get_deployment_status(self, deployment_id: str) -> Tuple[bool, str, str]:
         """Get deployment status."""
         try:
-            response = requests.get(
-                f"{self.api_base}/v13/deployments/{deployment_id}",
-                headers=self.headers
+            response = self._request(
+                'get',
+                f"{self.api_base}/v13/deployments/{deployment_id}"
             )
             
             if response.status_code == 200:
@@ -134,12 +409,36 @@ class VercelAPIIntegration:
         except Exception as e:
             return False, f"Status error: {str(e)}", ""
     
+    def wait(self, deployment_id: str, timeout: float = 900) -> Tuple[bool, str, str]:
+        """
+        Poll a deployment until it reaches a terminal state or timeout expires.
+        
+        The poll interval backs off exponentially with jitter up to
+        POLL_MAX_DELAY, so quick deployments are noticed early while long
+        builds do not burn through the API rate limit.
+        """
+        deadline = time.monotonic() + timeout
+        attempt = 0
+        
+        while True:
+            success, status, url = self.get_deployment_status(deployment_id)
+            if success and status in TERMINAL_STATES:
+                return status == "READY", status, url
+            
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False, f"Timed out waiting for deployment (last status: {status})", url
+            
+            delay = min(POLL_MAX_DELAY, 0.5 * 2 ** attempt + random.uniform(0, 0.5))
+            time.sleep(min(delay, remaining))
+            attempt += 1
+    
     def list_projects(self) -> Tuple[bool, List[Dict], str]:
         """List all projects."""
         try:
-            response = requests.get(
-                f"{self.api_base}/v9/projects",
-                headers=self.headers
+            response = self._request(
+                'get',
+                f"{self.api_base}/v9/projects"
             )
             
             if response.status_code == 200:
@@ -147,7 +446,7 @@ class VercelAPIIntegration:
                 projects = projects_data.get('projects', [])
                 return True, projects, "Projects retrieved successfully"
             else:
-                error_msg = response.json().get('error', {}).get('message', 'Failed to list projects')
+                error_msg = _extract_error(response, 'Failed to list projects')
                 return False, [], error_msg
                 
         except Exception as e:
@@ -1,12 +1,16 @@
 """
 Vercel project auto-creation functionality.
 """
+import os
+import re
 from typing import Tuple, Optional
-from pathlib import Path
 from core.logging import get_logger
 from .api_integration import VercelAPIIntegration
 from .cli_integration import VercelCLIIntegration
 
+# Runs of characters that cannot appear in a Vercel project name
+_SLUG_RE = re.compile(r'[^a-z0-9]+')
+
 class VercelAutoCreation:
     """Handles automatic Vercel project creation and setup."""
     
@@ -30,14 +34,19 @@ class VercelAutoCreation:
         Returns:
             Tuple of (should_create, reason)
         """
+        # Read the directory once instead of stat-ing each marker
+        try:
+            with os.scandir(project_path) as entries:
+                names = {entry.name for entry in entries}
+        except OSError:
+            names = set()
+        
         # Check for existing Vercel configuration
-        vercel_config = Path(project_path) / '.vercel'
-        if vercel_config.exists():
+        if '.vercel' in names:
             return False, "Vercel project already configured"
         
         # Check for vercel.json
-        vercel_json = Path(project_path) / 'vercel.json'
-        if vercel_json.exists():
+        if 'vercel.json' in names:
             return False, "vercel.json found, project may already exist"
         
         return True, "No Vercel project detected"
@@ -80,11 +89,7 @@ class VercelAutoCreation:
     
     def _generate_suggested_name(self, project_name: str) -> str:
         """Generate a suggested project name."""
-        # Clean up project name
-        suggested = project_name.lower().replace(" ", "-").replace("_", "-")
-        # Remove invalid characters
-        suggested = "".join(c for c in suggested if c.isalnum() or c == "-")
-        return suggested
+        return _SLUG_RE.sub("-", project_name.lower()).strip("-")
     
     def _prompt_for_project_name(self, suggested_name: str) -> Optional[str]:
         """Prompt user for project name with suggestion."""
@@ -96,9 +101,7 @@ class VercelAutoCreation:
                 return suggested_name
             
             # Clean custom name
-            custom_name = user_input.lower().replace(" ", "-").replace("_", "-")
-            custom_name = "".join(c for c in custom_name if c.isalnum() or c == "-")
-            return custom_name
+            return self._generate_suggested_name(user_input)
             
         except KeyboardInterrupt:
             print("\n❌ Project creation cancelled")
@@ -3,41 +3,68 @@ Vercel CLI integration for authentication and project management.
 """
 import subprocess
 import json
+import re
+import time
 from typing import Optional, Tuple, Dict, Any
 from pathlib import Path
 from core.logging import get_logger
+from .._process import run_cli
+
+# Seconds a `whoami` probe result is reused before asking the CLI again
+PROBE_TTL = 60.0
+
+# Seconds to wait for quick CLI commands (whoami, status, linking) and for
+# deployments before giving up on a hung `vercel` process
+COMMAND_TIMEOUT = 30
+DEPLOY_TIMEOUT = 600
+
+_URL_RE = re.compile(r'https://\S+\.vercel\.app\S*')
 
 class VercelCLIIntegration:
     """Integration with Vercel CLI for authentication and operations."""
     
     def __init__(self):
         self.logger = get_logger(__name__)
+        self._cli_available: Optional[bool] = None
+        self._cli_user: Optional[str] = None
+        self._probe_ts = 0.0
     
-    def is_cli_available(self) -> bool:
-        """Check if Vercel CLI is installed and authenticated."""
+    def _probe(self) -> Tuple[bool, Optional[str]]:
+        """Run `vercel whoami`, reusing the result for PROBE_TTL seconds."""
+        if self._cli_available is not None and time.monotonic() - self._probe_ts < PROBE_TTL:
+            return self._cli_available, self._cli_user
+        
         try:
-            result = subprocess.run(
+            result = run_cli(
                 ["vercel", "whoami"],
                 capture_output=True,
-                text=True
+                text=True,
+                timeout=COMMAND_TIMEOUT
             )
-            return result.returncode == 0
+            available = result.returncode == 0
+            user = result.stdout.strip() if available else None
         except FileNotFoundError:
-            return False
+            available, user = False, None
+        except subprocess.TimeoutExpired:
+            self.logger.warning(f"Vercel CLI did not answer whoami within {COMMAND_TIMEOUT}s")
+            return False, None
+        except Exception as e:
+            self.logger.error(f"Failed to get authenticated user: {e}")
+            return False, None
+        
+        self._cli_available, self._cli_user = available, user
+        self._probe_ts = time.monotonic()
+        return available, user
+    
+    def is_cli_available(self) -> bool:
+        """Check if Vercel CLI is installed and authenticated."""
+        available, _ = self._probe()
+        return available
     
     def get_authenticated_user(self) -> Optional[str]:
         """Get the authenticated Vercel username."""
-        try:
-            result = subprocess.run(
-                ["vercel", "whoami"],
-                capture_output=True,
-                text=True
-            )
-            if result.returncode == 0:
-                return result.stdout.strip()
-        except Exception as e:
-            self.logger.error(f"Failed to get authenticated user: {e}")
-        return None
+        _, user = self._probe()
+        return user
     
     def get_token(self) -> Optional[str]:
         """Get Vercel token from CLI config."""
@@ -55,11 +82,12 @@ class VercelCLIIntegration:
     def create_project(self, project_name: str, project_path: str = ".") -> Tuple[bool, str]:
         """Create a Vercel project using CLI."""
         try:
-            result = subprocess.run(
+            result = run_cli(
                 ["vercel", "--yes", "--name", project_name],
                 cwd=project_path,
                 capture_output=True,
-                text=True
+                text=True,
+                timeout=DEPLOY_TIMEOUT
             )
             
             if result.returncode == 0:
@@ -68,42 +96,47 @@ class VercelCLIIntegration:
             else:
                 return False, f"Failed to create project: {result.stderr}"
                 
+        except subprocess.TimeoutExpired:
+            return False, f"Project creation timed out after {DEPLOY_TIMEOUT}s"
         except Exception as e:
             return False, f"Failed to create project: {str(e)}"
     
     def deploy_project(self, project_path: str = ".") -> Tuple[bool, str, Optional[str]]:
         """Deploy project using Vercel CLI."""
         try:
-            result = subprocess.run(
+            result = run_cli(
                 ["vercel", "--prod", "--yes"],
                 cwd=project_path,
                 capture_output=True,
-                text=True
+                text=True,
+                timeout=DEPLOY_TIMEOUT
             )
             
             if result.returncode == 0:
                 # Extract URL from output
-                lines = result.stdout.strip().split('\n')
-                url = None
-                for line in lines:
-                    if 'https://' in line and 'vercel.app' in line:
-                        url = line.strip()
-                        break
+                match = _URL_RE.search(result.stdout)
+                url = match.group(0) if match else None
                 
                 return True, "Deployment successful", url
             else:
                 return False, f"Deployment failed: {result.stderr}", None
                 
+        except subprocess.TimeoutExpired as e:
+            # Keep whatever the CLI printed before it was killed
+            if e.stdout:
+                self.logger.error(f"Partial deploy output: {e.stdout}")
+            return False, f"Deployment timed out after {DEPLOY_TIMEOUT}s", None
         except Exception as e:
             return False, f"Deployment failed: {str(e)}", None
     
     def get_project_info(self, project_name: str) -> Optional[Dict[str, Any]]:
         """Get project information."""
         try:
-            result = subprocess.run(
+            result = run_cli(
                 ["vercel", "ls", project_name, "--json"],
                 capture_output=True,
-                text=True
+                text=True,
+                timeout=COMMAND_TIMEOUT
             )
             if result.returncode == 0:
                 return json.loads(result.stdout)
@@ -2,15 +2,22 @@
 Vercel deployment platform implementation.
 """
 import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, Optional, Tuple
 
-from utils.errors import retry_with_backoff, handle_auth_error
+from core.constants import TOKEN_FILES
+from utils.errors import handle_auth_error
 from ..base import BasePlatform, DeploymentResult, DeploymentStatus
 from .cli_integration import VercelCLIIntegration
 from .api_integration import VercelAPIIntegration
 from .auto_creation import VercelAutoCreation
 
+# Seconds a successful credential check is trusted before listing projects
+# again; covers the validate -> prepare -> execute sequence of one deploy
+VALIDATION_TTL = 60.0
+
 class VercelPlatform(BasePlatform):
     """Vercel deployment platform with CLI and API integration."""
     
@@ -29,11 +36,36 @@ class VercelPlatform(BasePlatform):
         
         # Initialize components
         self.cli_integration = VercelCLIIntegration()
+        self._token_cache: Tuple[Optional[Tuple[str, int]], Optional[str]] = (None, None)
         
         # Get token and initialize other components
+        self.api_integration: Optional[VercelAPIIntegration] = None
+        self.auto_creation: Optional[VercelAutoCreation] = None
+        self._components_token: Optional[str] = None
+        self._validated_at: Optional[float] = None
+        self._validated_message = ""
         self.token = self._get_token()
+        self._ensure_components()
+    
+    @property
+    def project_name(self) -> Optional[str]:
+        """Vercel project name; assigning it also refreshes the cached URL."""
+        return self._project_name
+    
+    @project_name.setter
+    def project_name(self, name: Optional[str]) -> None:
+        self._project_name = name
+        self._url = f"https://{name}.vercel.app" if name else None
+    
+    def _ensure_components(self) -> None:
+        """Build the API and auto-creation helpers, rebuilding only when the token changes."""
+        if self.token == self._components_token:
+            return
+        
         self.api_integration = VercelAPIIntegration(self.token) if self.token else None
         self.auto_creation = VercelAutoCreation(self.token, self.use_cli) if self.token else None
+        self._components_token = self.token
+        self._validated_at = None
     
     def _get_token(self) -> Optional[str]:
         """Get Vercel token from CLI, file, or environment."""
@@ -44,21 +76,37 @@ class VercelPlatform(BasePlatform):
                 return token
         
         # Try .deployx_vercel_token file
-        try:
-            token_file = Path('.deployx_vercel_token')
-            if token_file.exists():
-                token = token_file.read_text().strip()
-                if token:
-                    return token
-        except Exception:
-            pass
+        token = self._read_token_file()
+        if token:
+            return token
         
         # Fallback to environment variable
         return os.getenv('VERCEL_TOKEN')
     
-    @retry_with_backoff(max_retries=3)
+    def _read_token_file(self) -> Optional[str]:
+        """Read .deployx_vercel_token, skipping the read while its mtime is unchanged."""
+        try:
+            token_file = os.path.abspath(TOKEN_FILES['vercel'])
+            key = (token_file, os.stat(token_file).st_mtime_ns)
+            
+            cached_key, cached_token = self._token_cache
+            if cached_key == key:
+                return cached_token
+            
+            with open(token_file, 'r') as f:
+                token = f.read().strip() or None
+            self._token_cache = (key, token)
+            return token
+        except Exception:
+            return None
+    
     def validate_credentials(self) -> Tuple[bool, str]:
-        """Validate Vercel token and access."""
+        """
+        Validate Vercel token and access.
+        
+        Transient network failures are retried per request by the API
+        integration's session, so this method is not wrapped in a retry.
+        """
         # Refresh token (in case it was updated)
         self.token = self._get_token()
         
@@ -66,39 +114,62 @@ class VercelPlatform(BasePlatform):
             error = handle_auth_error("vercel", "No token provided")
             return False, error.message
         
-        # Initialize components if not available
+        self._ensure_components()
+        
+        # Skip the round trip if this token was validated moments ago
+        if self._validated_at is not None and time.monotonic() - self._validated_at < VALIDATION_TTL:
+            return True, self._validated_message
+        
         if not self.api_integration:
-            self.api_integration = VercelAPIIntegration(self.token)
-        if not self.auto_creation:
-            self.auto_creation = VercelAutoCreation(self.token, self.use_cli)
-        
-        # Auto-create project if needed
-        if self.auto_creation and not self.project_name:
-            project_name = os.path.basename(os.getcwd())
-            success, message, project_url = self.auto_creation.auto_create_project(
-                project_name, ".", self.framework
-            )
-            
-            if success and project_url:
-                self.project_name = project_name
-                self.logger.info(f"Auto-created Vercel project: {project_name}")
-            elif not success:
-                return False, f"Project creation failed: {message}"
+            return False, "No API integration available"
         
-        # Validate token by listing projects
         try:
-            if self.api_integration:
-                success, projects, message = self.api_integration.list_projects()
-                if success:
-                    return True, f"Vercel credentials valid - {len(projects)} projects accessible"
-                else:
-                    return False, f"Token validation failed: {message}"
+            # Validate the token by listing projects; the request runs in the
+            # background while the auto-creation check looks at the project
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                list_future = executor.submit(self.api_integration.list_projects)
+                
+                # Auto-create project if needed
+                if self.auto_creation and not self.project_name:
+                    created, message = self._auto_create_project(list_future)
+                    if not created:
+                        return False, f"Project creation failed: {message}"
+                
+                success, projects, message = list_future.result()
+            
+            if success:
+                self._validated_at = time.monotonic()
+                self._validated_message = f"Vercel credentials valid - {len(projects)} projects accessible"
+                return True, self._validated_message
             else:
-                return False, "No API integration available"
+                return False, f"Token validation failed: {message}"
                 
         except Exception as e:
             return False, f"Credential validation failed: {str(e)}"
     
+    def _auto_create_project(self, list_future: Future) -> Tuple[bool, str]:
+        """Create a Vercel project for the current directory unless one already exists."""
+        should_create, reason = self.auto_creation.should_create_project(".")
+        if not should_create:
+            return True, reason
+        
+        # Reuse an existing project of the same name instead of racing to create it
+        project_name = os.path.basename(os.getcwd())
+        suggested_name = self.auto_creation._generate_suggested_name(project_name)
+        success, projects, _ = list_future.result()
+        if success and any(project.get('name') == suggested_name for project in projects):
+            self.project_name = suggested_name
+            return True, f"Using existing Vercel project: {suggested_name}"
+        
+        success, message, project_url = self.auto_creation.auto_create_project(
+            project_name, ".", self.framework
+        )
+        
+        if success and project_url:
+            self.project_name = project_name
+            self.logger.info(f"Auto-created Vercel project: {project_name}")
+        return success, message
+    
     def prepare_deployment(self, project_path: str, build_command: Optional[str], output_dir: str) -> Tuple[bool, str]:
         """Prepare for deployment by validating credentials."""
         valid, message = self.validate_credentials()
@@ -114,6 +185,8 @@ class VercelPlatform(BasePlatform):
     
     def execute_deployment(self, project_path: str, output_dir: str) -> DeploymentResult:
         """Execute deployment to Vercel."""
+        self._ensure_components()
+        
         try:
             # Try CLI deployment first if available
             if self.use_cli and self.cli_integration.is_cli_available():
@@ -155,6 +228,8 @@ class VercelPlatform(BasePlatform):
         # Upload files
         success, message, files_data = self.api_integration.upload_files(project_path, output_dir)
         if not success:
+            # The token may have been revoked; check it again next time
+            self._validated_at = None
             return DeploymentResult(
                 success=False,
                 message=f"File upload failed: {message}",
@@ -166,6 +241,8 @@ class VercelPlatform(BasePlatform):
         success, message, url = self.api_integration.create_deployment(
             self.project_name or "deployx-project", files_data
         )
+        if not success:
+            self._validated_at = None
         
         return DeploymentResult(
             success=success,
@@ -176,25 +253,18 @@ class VercelPlatform(BasePlatform):
     
     def get_deployment_status(self) -> DeploymentStatus:
         """Get current deployment status."""
-        try:
-            if self.project_name:
-                return DeploymentStatus(
-                    status="deployed",
-                    message=f"Vercel project: {self.project_name}",
-                    url=f"https://{self.project_name}.vercel.app"
-                )
-            else:
-                return DeploymentStatus(
-                    status="not_deployed",
-                    message="No Vercel project configured",
-                    url=None
-                )
-        except Exception as e:
+        # Pure attribute reads, so there is nothing here that can raise
+        if self._url:
             return DeploymentStatus(
-                status="error",
-                message=f"Failed to get status: {str(e)}",
-                url=None
+                status="deployed",
+                message=f"Vercel project: {self.project_name}",
+                url=self._url
             )
+        return DeploymentStatus(
+            status="not_deployed",
+            message="No Vercel project configured",
+            url=None
+        )
     
     def get_status(self, deployment_id: Optional[str] = None) -> DeploymentStatus:
         """Get deployment status."""
@@ -202,6 +272,4 @@ class VercelPlatform(BasePlatform):
     
     def get_url(self) -> Optional[str]:
         """Get the deployment URL."""
-        if self.project_name:
-            return f"https://{self.project_name}.vercel.app"
-        return None
+        return self._url
@@ -0,0 +1,37 @@
+"""
+Quick smoke test for DeployX, run by ``run_all_tests.py --quick``.
+"""
+import importlib
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Modules on the CLI's startup path, heaviest first
+WARM_IMPORTS = ['platforms.factory', 'cli.factory', 'commands.auth']
+
+def main() -> int:
+    """Import the core modules and exercise the CLI and platform factories."""
+    # Time the cold imports so startup regressions show up in the output
+    for module in WARM_IMPORTS:
+        start = time.perf_counter()
+        importlib.import_module(module)
+        print(f"✅ Imported {module} in {(time.perf_counter() - start) * 1000:.1f}ms")
+    
+    from cli.factory import create_cli
+    from platforms.factory import PlatformFactory
+    
+    # Test CLI creation
+    create_cli("0.8.0")
+    print("✅ CLI creation works")
+    
+    # Test platform factory
+    platforms = PlatformFactory.get_available_platforms()
+    print(f"✅ Platform factory works: {len(platforms)} platforms")
+    
+    print("🎉 Smoke test passed!")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,67 @@
+"""
+Shared pytest fixtures for the DeployX test suite.
+"""
+import os
+import subprocess
+import tempfile
+from types import SimpleNamespace
+
+import pytest
+
+# Minimal page standing in for a built site
+INDEX_HTML = b'<html><body>Test</body></html>'
+
+# RAM-backed filesystem on Linux; test directories are small and short-lived
+TMPFS_DIR = '/dev/shm'
+
+def pytest_configure(config):
+    """Put pytest's temp root on tmpfs unless TMPDIR chooses a location."""
+    # Runs before tmp_path's base directory is first computed, and before
+    # xdist hands that base directory to its workers
+    if 'TMPDIR' not in os.environ and os.path.isdir(TMPFS_DIR) and os.access(TMPFS_DIR, os.W_OK):
+        tempfile.tempdir = TMPFS_DIR
+
+class FakeRun:
+    """
+    Stand-in for subprocess.run that replays queued results.
+    
+    Each call builds a plain result object from the next dict in `results`,
+    with empty stdout/stderr by default, and the last one keeps repeating.
+    With nothing queued, every command behaves as if it were not installed.
+    Received argv lists are kept in `calls`.
+    """
+    
+    def __init__(self):
+        self.results = []
+        self.calls = []
+    
+    def __call__(self, args, **kwargs):
+        self.calls.append(args)
+        if not self.results:
+            raise FileNotFoundError(f"No such file or directory: {args[0]!r}")
+        spec = self.results.pop(0) if len(self.results) > 1 else self.results[0]
+        return SimpleNamespace(**{'returncode': 0, 'stdout': '', 'stderr': '', **spec})
+
+@pytest.fixture
+def fake_subprocess(monkeypatch):
+    """Route subprocess.run through a FakeRun for the duration of a test."""
+    fake = FakeRun()
+    monkeypatch.setattr(subprocess, 'run', fake)
+    return fake
+
+def _build_project(path):
+    """Lay out a built site at build/index.html under path."""
+    build_dir = path / 'build'
+    build_dir.mkdir()
+    (build_dir / 'index.html').write_bytes(INDEX_HTML)
+    return path
+
+@pytest.fixture
+def deploy_project(tmp_path):
+    """Project directory holding a built site at build/index.html."""
+    return _build_project(tmp_path)
+
+@pytest.fixture(scope='class')
+def shared_deploy_project(tmp_path_factory):
+    """Like deploy_project, but built once per test class; tests must not write to it."""
+    return _build_project(tmp_path_factory.mktemp('project'))
@@ -1,14 +1,45 @@
 """
 Tests for API integrations across all platforms.
 """
+import base64
+import hashlib
+import io
+import json
+import zipfile
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 import requests
 
-from platforms.vercel.api_integration import VercelAPIIntegration
+from platforms.vercel.api_integration import VercelAPIIntegration, INLINE_FILE_LIMIT
 from platforms.railway.api_integration import RailwayAPIIntegration
 from platforms.netlify.api_integration import NetlifyAPIIntegration
 
+def _response(status_code, payload=None, content=None, headers=None):
+    """Build a real requests.Response carrying a canned JSON payload."""
+    response = requests.Response()
+    response.status_code = status_code
+    response.encoding = 'utf-8'
+    response.headers.update(headers or {})
+    if content is None:
+        content = json.dumps(payload).encode() if payload is not None else b''
+    response._content = content
+    return response
+
+@pytest.fixture(scope="module")
+def vercel_api():
+    """Vercel API client shared by the tests in this module."""
+    return VercelAPIIntegration('test_token')
+
+@pytest.fixture(scope="module")
+def railway_api():
+    """Railway API client shared by the tests in this module."""
+    return RailwayAPIIntegration('test_token')
+
+@pytest.fixture(scope="module")
+def netlify_api():
+    """Netlify API client shared by the tests in this module."""
+    return NetlifyAPIIntegration('test_token')
+
 class TestAPIIntegrations:
     """Test API integrations for all platforms."""
     
@@ -16,67 +47,47 @@ class TestAPIIntegrations:
     def test_github_api_validation(self, mock_get):
         """Test GitHub API token validation."""
         # Mock successful response
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {'login': 'testuser', 'email': 'test@example.com'}
+        mock_response = _response(200, {'login': 'testuser', 'email': 'test@example.com'})
         mock_get.return_value = mock_response
         
         # This would require implementing GitHubAPIIntegration
         # For now, test the concept
         assert mock_response.status_code == 200
     
-    @patch('requests.get')
-    def test_vercel_api_validation(self, mock_get):
+    @pytest.mark.parametrize("client, target, status_code, payload, expected_valid, expected_text", [
+        ('railway_api', 'requests.Session.post', 200,
+         {'data': {'me': {'id': '123', 'email': 'test@example.com'}}}, True, ['test@example.com']),
+        ('netlify_api', 'requests.Session.get', 200,
+         {'email': 'test@example.com', 'full_name': 'Test User'}, True, ['test@example.com']),
+        ('railway_api', 'requests.Session.post', 401,
+         {'message': 'Unauthorized'}, False, ['api error', 'unauthorized', 'invalid']),
+        ('netlify_api', 'requests.Session.get', 429,
+         {'message': 'Rate limit exceeded'}, False, ['rate', '429']),
+    ])
+    def test_token_validation(self, request, client, target, status_code, payload, expected_valid, expected_text):
+        """Test token validation responses across platforms."""
+        api = request.getfixturevalue(client)
+        with patch(target, return_value=_response(status_code, payload)), patch('utils.errors.time.sleep'):
+            valid, message, user_data = api.validate_token()
+        
+        assert valid is expected_valid
+        assert any(text in message.lower() for text in expected_text)
+        assert (user_data is not None) is expected_valid
+    
+    @patch('requests.Session.get')
+    def test_vercel_api_validation(self, mock_get, vercel_api):
         """Test Vercel API token validation."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {'user': {'email': 'test@example.com'}}
-        mock_get.return_value = mock_response
+        mock_get.return_value = _response(200, {'user': {'email': 'test@example.com'}})
         
-        api = VercelAPIIntegration('test_token')
-        success, projects, message = api.list_projects()
+        success, projects, message = vercel_api.list_projects()
         
         # Should handle the API call
         assert isinstance(success, bool)
     
-    @patch('requests.post')
-    def test_railway_api_validation(self, mock_post):
-        """Test Railway API token validation."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            'data': {'me': {'id': '123', 'email': 'test@example.com'}}
-        }
-        mock_post.return_value = mock_response
-        
-        api = RailwayAPIIntegration('test_token')
-        valid, message, user_data = api.validate_token()
-        
-        assert valid is True
-        assert 'test@example.com' in message
-        assert user_data is not None
-    
-    @patch('requests.get')
-    def test_netlify_api_validation(self, mock_get):
-        """Test Netlify API token validation."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {'email': 'test@example.com', 'full_name': 'Test User'}
-        mock_get.return_value = mock_response
-        
-        api = NetlifyAPIIntegration('test_token')
-        valid, message, user_data = api.validate_token()
-        
-        assert valid is True
-        assert 'test@example.com' in message
-        assert user_data is not None
-    
-    @patch('requests.post')
-    def test_railway_project_creation(self, mock_post):
+    @patch('requests.Session.post')
+    def test_railway_project_creation(self, mock_post, railway_api):
         """Test Railway project creation via API."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_post.return_value = _response(200, {
             'data': {
                 'projectCreate': {
                     'id': 'project_123',
@@ -84,112 +95,283 @@ class TestAPIIntegrations:
                     'description': 'Test project'
                 }
             }
-        }
-        mock_post.return_value = mock_response
+        })
         
-        api = RailwayAPIIntegration('test_token')
-        success, message, project_id = api.create_project('test-project')
+        success, message, project_id = railway_api.create_project('test-project')
         
         assert success is True
         assert project_id == 'project_123'
         assert 'test-project' in message
     
-    @patch('requests.post')
-    def test_netlify_site_creation(self, mock_post):
+    @patch('requests.Session.post')
+    def test_netlify_site_creation(self, mock_post, netlify_api):
         """Test Netlify site creation via API."""
-        mock_response = MagicMock()
-        mock_response.status_code = 201
-        mock_response.json.return_value = {
+        mock_post.return_value = _response(201, {
             'id': 'site_123',
             'name': 'test-site',
             'url': 'https://test-site.netlify.app'
-        }
-        mock_post.return_value = mock_response
+        })
         
-        api = NetlifyAPIIntegration('test_token')
-        success, message, site_id = api.create_site('test-site')
+        success, message, site_id = netlify_api.create_site('test-site')
         
         assert success is True
         assert site_id == 'site_123'
         assert 'test-site' in message
     
-    @patch('requests.post')
-    def test_vercel_project_creation(self, mock_post):
+    @patch('requests.Session.post')
+    def test_netlify_zip_deploy(self, mock_post, tmp_path, netlify_api):
+        """Test Netlify deploys stream a zip of the build directory."""
+        uploaded = {}
+        
+        def read_body(url, headers, data):
+            uploaded['content_type'] = headers['Content-Type']
+            uploaded['archive'] = data.read()
+            return _response(200, {'url': 'https://test-site.netlify.app'})
+        
+        mock_post.side_effect = read_body
+        build_dir = tmp_path / 'dist'
+        (build_dir / 'assets').mkdir(parents=True)
+        (build_dir / 'index.html').write_bytes(b'<h1>Test</h1>')
+        (build_dir / 'assets' / 'app.js').write_bytes(b'console.log(1)')
+        (build_dir / 'assets' / 'logo.png').write_bytes(b'\x89PNG')
+        
+        success, message, url = netlify_api.deploy_site('site_123', str(tmp_path), 'dist')
+        
+        assert success is True
+        assert url == 'https://test-site.netlify.app'
+        assert uploaded['content_type'] == 'application/zip'
+        with zipfile.ZipFile(io.BytesIO(uploaded['archive'])) as archive:
+            assert sorted(archive.namelist()) == ['assets/app.js', 'assets/logo.png', 'index.html']
+            assert archive.read('index.html') == b'<h1>Test</h1>'
+            # Text is deflated, already-compressed formats are stored
+            assert archive.getinfo('index.html').compress_type == zipfile.ZIP_DEFLATED
+            assert archive.getinfo('assets/logo.png').compress_type == zipfile.ZIP_STORED
+    
+    @patch('requests.Session.post')
+    def test_vercel_project_creation(self, mock_post, vercel_api):
         """Test Vercel project creation via API."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_post.return_value = _response(200, {
             'id': 'project_123',
             'name': 'test-project'
-        }
-        mock_post.return_value = mock_response
+        })
         
-        api = VercelAPIIntegration('test_token')
-        success, message, project_id = api.create_project('test-project')
+        success, message, project_id = vercel_api.create_project('test-project')
         
         assert success is True
         assert project_id == 'project_123'
     
-    @patch('requests.post')
-    def test_api_error_handling(self, mock_post):
-        """Test API error handling."""
-        # Test 401 Unauthorized
-        mock_response = MagicMock()
-        mock_response.status_code = 401
-        mock_response.json.return_value = {'message': 'Unauthorized'}
-        mock_post.return_value = mock_response
+    @patch('requests.Session.post')
+    def test_vercel_error_extraction(self, mock_post, vercel_api):
+        """Test Vercel error messages are read safely from any response body."""
+        api_error = _response(400, {'error': {'message': 'Project name taken'}})
+        gateway_error = _response(500, content=b'<html>Bad Gateway</html>')
+        mock_post.side_effect = [api_error, gateway_error]
         
-        api = RailwayAPIIntegration('invalid_token')
-        valid, message, user_data = api.validate_token()
+        success, message, project_id = vercel_api.create_project('test-project')
+        assert success is False
+        assert 'Project name taken' in message
         
-        assert valid is False
-        assert 'api error' in message.lower() or 'unauthorized' in message.lower() or 'invalid' in message.lower()
+        success, message, project_id = vercel_api.create_project('test-project')
+        assert success is False
+        assert 'Unknown error' in message
+    
+    @patch('requests.Session.post')
+    def test_vercel_file_upload(self, mock_post, tmp_path, vercel_api):
+        """Test Vercel inlines small files and uploads large ones by digest."""
+        mock_post.return_value = _response(200)
+        
+        large_content = b'x' * (INLINE_FILE_LIMIT + 1)
+        build_dir = tmp_path / 'build'
+        (build_dir / 'assets').mkdir(parents=True)
+        (build_dir / 'index.html').write_bytes(b'<h1>Test</h1>')
+        (build_dir / 'assets' / 'app.js').write_bytes(large_content)
+        
+        success, message, files = vercel_api.upload_files(str(tmp_path), 'build')
+        
+        assert success is True
+        assert sorted(f['file'] for f in files) == ['assets/app.js', 'index.html']
+        
+        index = next(f for f in files if f['file'] == 'index.html')
+        assert index['encoding'] == 'base64'
+        assert base64.b64decode(index['data']) == b'<h1>Test</h1>'
+        
+        # Only the large file goes through /v2/files
+        mock_post.assert_called_once()
+        app = next(f for f in files if f['file'] == 'assets/app.js')
+        assert app['sha'] == hashlib.sha1(large_content).hexdigest()
+        assert app['size'] == len(large_content)
+        assert mock_post.call_args.kwargs['headers']['x-vercel-digest'] == app['sha']
     
-    @patch('requests.post')
-    def test_network_error_handling(self, mock_post):
+    @patch('requests.Session.post')
+    def test_vercel_upload_ignores(self, mock_post, tmp_path, vercel_api):
+        """Test VCS metadata, dependencies and secrets are never uploaded."""
+        build_dir = tmp_path / 'build'
+        for relative in ['.git/config', 'node_modules/pkg/index.js', '.well-known/security.txt']:
+            (build_dir / relative).parent.mkdir(parents=True, exist_ok=True)
+            (build_dir / relative).write_bytes(b'data')
+        (build_dir / '.env.local').write_bytes(b'SECRET=1')
+        (build_dir / '.deployx_vercel_token').write_bytes(b'token')
+        (build_dir / 'index.html').write_bytes(b'<h1>Test</h1>')
+        
+        success, message, files = vercel_api.upload_files(str(tmp_path), 'build')
+        
+        assert success is True
+        assert sorted(f['file'] for f in files) == ['.well-known/security.txt', 'index.html']
+    
+    @patch('platforms.vercel.api_integration.INLINE_BATCH_LIMIT', 8)
+    @patch('requests.Session.post')
+    def test_vercel_inline_smallest_first(self, mock_post, tmp_path, vercel_api):
+        """Test the inline budget is filled with the smallest files first."""
+        mock_post.return_value = _response(200)
+        
+        build_dir = tmp_path / 'build'
+        build_dir.mkdir()
+        (build_dir / 'a.css').write_bytes(b'x' * 7)
+        (build_dir / 'b.js').write_bytes(b'x' * 3)
+        (build_dir / 'c.svg').write_bytes(b'x' * 4)
+        
+        success, message, files = vercel_api.upload_files(str(tmp_path), 'build')
+        
+        assert success is True
+        inlined = sorted(f['file'] for f in files if 'data' in f)
+        assert inlined == ['b.js', 'c.svg']
+        mock_post.assert_called_once()
+    
+    @patch('requests.Session.post')
+    def test_vercel_upload_manifest(self, mock_post, tmp_path):
+        """Test unchanged files are skipped on redeploy and restored if Vercel expired them."""
+        large_content = b'x' * (INLINE_FILE_LIMIT + 1)
+        build_dir = tmp_path / 'build'
+        build_dir.mkdir()
+        (build_dir / 'app.js').write_bytes(large_content)
+        (tmp_path / '.gitignore').write_text('node_modules')
+        sha = hashlib.sha1(large_content).hexdigest()
+        
+        api = VercelAPIIntegration('test_token')
+        mock_post.return_value = _response(200)
+        success, message, files = api.upload_files(str(tmp_path), 'build')
+        assert success is True
+        assert (tmp_path / '.deployx_upload_manifest.json').exists()
+        assert (tmp_path / '.gitignore').read_text() == 'node_modules\n.deployx_upload_manifest.json\n'
+        assert mock_post.call_count == 1
+        
+        # Second deploy references the file by its recorded digest
+        success, message, files = api.upload_files(str(tmp_path), 'build')
+        assert success is True
+        assert files == [{'file': 'app.js', 'sha': sha, 'size': len(large_content)}]
+        assert mock_post.call_count == 1
+        
+        mock_post.side_effect = [
+            _response(400, {'error': {'code': 'missing_files', 'missing': [sha]}}),
+            _response(200),
+            _response(200, {'url': 'test.vercel.app'}),
+        ]
+        success, message, url = api.create_deployment('test-project', files)
+        assert success is True
+        assert url == 'https://test.vercel.app'
+        assert mock_post.call_args_list[2].kwargs['headers']['x-vercel-digest'] == sha
+    
+    @patch('requests.Session.post')
+    def test_vercel_upload_manifest_outside_git(self, mock_post, tmp_path, capsys):
+        """Test the manifest never creates a .gitignore or prints when the project has none."""
+        (tmp_path / 'build').mkdir()
+        (tmp_path / 'build' / 'app.js').write_bytes(b'x' * (INLINE_FILE_LIMIT + 1))
+        
+        mock_post.return_value = _response(200)
+        success, message, files = VercelAPIIntegration('test_token').upload_files(str(tmp_path), 'build')
+        assert success is True
+        assert (tmp_path / '.deployx_upload_manifest.json').exists()
+        assert not (tmp_path / '.gitignore').exists()
+        assert capsys.readouterr().out == ''
+    
+    @patch('platforms.vercel.api_integration.time.sleep')
+    @patch('requests.Session.get')
+    def test_vercel_wait_for_deployment(self, mock_get, mock_sleep, vercel_api):
+        """Test deployment polling stops at a terminal state."""
+        mock_get.side_effect = [
+            _response(200, {'readyState': state, 'url': 'test.vercel.app'})
+            for state in ('QUEUED', 'BUILDING', 'READY')
+        ]
+    
+        ready, status, url = vercel_api.wait('dpl_123')
+    
+        assert ready is True
+        assert status == 'READY'
+        assert mock_get.call_count == 3
+        assert mock_sleep.call_count == 2
+    
+    @patch('utils.errors.time.sleep')
+    @patch('requests.Session.post')
+    def test_network_error_handling(self, mock_post, mock_sleep, railway_api):
         """Test network error handling."""
         # Simulate network error
         mock_post.side_effect = requests.exceptions.ConnectionError("Network error")
         
-        api = RailwayAPIIntegration('test_token')
-        valid, message, user_data = api.validate_token()
+        valid, message, user_data = railway_api.validate_token()
         
         assert valid is False
         assert 'connection' in message.lower() or 'network' in message.lower()
     
-    @patch('requests.get')
-    def test_rate_limiting_handling(self, mock_get):
-        """Test rate limiting handling."""
-        # Test 429 Too Many Requests
-        mock_response = MagicMock()
-        mock_response.status_code = 429
-        mock_response.json.return_value = {'message': 'Rate limit exceeded'}
-        mock_get.return_value = mock_response
+    @patch('utils.errors.time.sleep')
+    @patch('requests.Session.post')
+    def test_transient_error_retry(self, mock_post, mock_sleep, railway_api):
+        """Test transient API errors are retried with backoff."""
+        mock_post.side_effect = [
+            _response(503, headers={'Retry-After': '2'}),
+            _response(200, {'data': {'me': {'id': '123', 'email': 'test@example.com'}}}),
+        ]
         
-        api = NetlifyAPIIntegration('test_token')
-        valid, message, user_data = api.validate_token()
+        valid, message, user_data = railway_api.validate_token()
+        
+        assert valid is True
+        assert mock_post.call_count == 2
+        mock_sleep.assert_called_once_with(2.0)
+    
+    @pytest.mark.parametrize('response,rejected', [
+        (_response(401), True),
+        (_response(200, {'errors': [{'message': 'Not Authorized'}]}), True),
+        (_response(500), False),
+        (requests.exceptions.ReadTimeout("401 ms"), False),
+    ])
+    @patch('utils.errors.time.sleep')
+    @patch('requests.Session.post')
+    def test_railway_token_rejection(self, mock_post, mock_sleep, railway_api, response, rejected):
+        """Test Railway reports a refused token separately from other failures."""
+        if isinstance(response, Exception):
+            mock_post.side_effect = response
+        else:
+            mock_post.return_value = response
+        
+        valid, message, user_data, was_rejected = railway_api.check_token()
         
         assert valid is False
-        assert 'rate' in message.lower() or '429' in message
+        assert was_rejected is rejected
     
-    def test_api_base_urls(self):
-        """Test that all APIs have correct base URLs."""
-        vercel_api = VercelAPIIntegration('test_token')
-        railway_api = RailwayAPIIntegration('test_token')
-        netlify_api = NetlifyAPIIntegration('test_token')
+    @patch('utils.errors.time.sleep')
+    @patch('requests.Session.post')
+    def test_mutation_not_retried_after_gateway_error(self, mock_post, mock_sleep, railway_api):
+        """Test create mutations are not resent once the server may have acted."""
+        mock_post.side_effect = [
+            _response(504),
+            _response(200, {'data': {'projectCreate': {'id': 'proj_1'}}}),
+        ]
         
+        success, message, project_id = railway_api.create_project('test-app')
+        
+        assert success is False
+        assert mock_post.call_count == 1
+        mock_sleep.assert_not_called()
+    
+    def test_api_base_urls(self, vercel_api, railway_api, netlify_api):
+        """Test that all APIs have correct base URLs."""
         assert vercel_api.api_base == "https://api.vercel.com"
         assert railway_api.api_base == "https://backboard.railway.app/graphql"
         assert netlify_api.api_base == "https://api.netlify.com/api/v1"
     
-    def test_api_headers(self):
+    def test_api_headers(self, vercel_api, railway_api, netlify_api):
         """Test that all APIs set correct headers."""
         token = 'test_token'
         
-        vercel_api = VercelAPIIntegration(token)
-        railway_api = RailwayAPIIntegration(token)
-        netlify_api = NetlifyAPIIntegration(token)
-        
         # All should have Authorization header
         assert 'Authorization' in vercel_api.headers
         assert 'Authorization' in railway_api.headers
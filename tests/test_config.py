@@ -1,6 +1,5 @@
 import unittest
 import tempfile
-import shutil
 import sys
 import os
 
@@ -12,12 +11,11 @@ from utils.validator import validate_config
 class TestConfig(unittest.TestCase):
     
     def setUp(self):
-        self.temp_dir = tempfile.mkdtemp()
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_dir = temp_dir.name
         self.config = Config(self.temp_dir)
     
-    def tearDown(self):
-        shutil.rmtree(self.temp_dir)
-    
     def test_config_not_exists_initially(self):
         """Test config file doesn't exist initially"""
         self.assertFalse(self.config.exists())
@@ -40,6 +38,28 @@ class TestConfig(unittest.TestCase):
         loaded_data = self.config.load()
         self.assertEqual(loaded_data, test_data)
     
+    def test_load_rereads_changed_file(self):
+        """Test cached configuration is refreshed when the file changes"""
+        self.config.save({'platform': 'github'})
+        self.assertEqual(Config(self.temp_dir).load(), {'platform': 'github'})
+        
+        with open(self.config.config_path, 'w') as f:
+            f.write('platform: netlify\n')
+        
+        self.assertEqual(Config(self.temp_dir).load(), {'platform': 'netlify'})
+    
+    def test_load_returns_private_copy(self):
+        """Test edits to loaded or saved data do not leak into other loads"""
+        saved = {'render': {'service_id': 'srv-1'}}
+        self.config.save(saved)
+        saved['render']['service_id'] = 'changed'
+        
+        loaded = Config(self.temp_dir).load()
+        loaded['render']['service_id'] = 'srv-2'
+        
+        self.assertEqual(Config(self.temp_dir).load(), {'render': {'service_id': 'srv-1'}})
+        self.assertEqual(self.config.get('render'), {'service_id': 'srv-1'})
+    
     def test_get_config_value(self):
         """Test getting configuration values"""
         test_data = {'platform': 'github', 'github': {'repo': 'test/repo'}}
@@ -1,7 +1,6 @@
 import unittest
 import os
 import tempfile
-import shutil
 from unittest.mock import Mock, patch
 from pathlib import Path
 import sys
@@ -18,7 +17,9 @@ class TestDeployCommand(unittest.TestCase):
     def setUp(self):
         """Set up test environment"""
         # Create temporary project directory
-        self.temp_dir = tempfile.mkdtemp()
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_dir = temp_dir.name
         self.project_path = Path(self.temp_dir)
         
         # Create valid configuration
@@ -54,7 +55,6 @@ class TestDeployCommand(unittest.TestCase):
     
     def tearDown(self):
         """Clean up test environment"""
-        shutil.rmtree(self.temp_dir)
         if 'GITHUB_TOKEN' in os.environ:
             del os.environ['GITHUB_TOKEN']
     
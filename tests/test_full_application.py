@@ -1,12 +1,14 @@
 """
 Full application integration tests for DeployX.
 """
+import asyncio
+import json
 import os
-import tempfile
-import shutil
+from operator import attrgetter
 from pathlib import Path
 import pytest
-from unittest.mock import patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import patch
 
 from cli.factory import create_cli
 from core.services import DeploymentService, InitService
@@ -14,67 +16,74 @@ from utils.config import Config
 from platforms.factory import get_platform, PlatformFactory
 from commands.auth import auth_status_command, auth_setup_command
 from platforms.base import DeploymentResult, DeploymentStatus
+from platforms.github.auto_creation import GitHubAutoCreation
+from platforms.github.cli_integration import GitHubCLIIntegration
+from platforms.vercel.cli_integration import VercelCLIIntegration
+from detectors.project import ProjectDetector
+from utils.build import BuildManager
+from utils.env_manager import EnvManager
+from utils.errors import handle_auth_error, handle_build_error
+from utils.validator import validate_config
+
+# Mock React project files, serialized once for every test
+PACKAGE_JSON_BYTES = json.dumps({
+    "name": "test-app",
+    "version": "1.0.0",
+    "scripts": {
+        "build": "echo 'Building...' && mkdir -p build && echo '<h1>Test App</h1>' > build/index.html"
+    },
+    "dependencies": {
+        "react": "^18.0.0"
+    }
+}, indent=2).encode()
+ENV_BYTES = b'REACT_APP_API_URL=https://api.example.com\nNODE_ENV=production\n'
+
+@pytest.fixture(scope="session")
+def cli_app():
+    """CLI application built once; the tests only inspect its commands."""
+    return create_cli("0.8.0")
+
+@pytest.fixture(scope="session")
+def event_loop_runner():
+    """One event loop reused by every test that drives an async service."""
+    loop = asyncio.new_event_loop()
+    yield loop.run_until_complete
+    loop.close()
 
 class TestFullApplication:
     """Test the complete DeployX application flow."""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup_project(self, tmp_path):
         """Set up test environment."""
-        self.test_dir = tempfile.mkdtemp()
-        self.original_cwd = os.getcwd()
-        os.chdir(self.test_dir)
+        # Tests address the project by path rather than chdir-ing into it,
+        # so they do not depend on the process working directory
+        self.test_dir = str(tmp_path)
+        self.project_path = tmp_path
         
         # Create a mock project structure
         self.create_mock_project()
     
-    def teardown_method(self):
-        """Clean up test environment."""
-        os.chdir(self.original_cwd)
-        shutil.rmtree(self.test_dir)
-    
     def create_mock_project(self):
         """Create a mock React project."""
-        # Create package.json
-        package_json = {
-            "name": "test-app",
-            "version": "1.0.0",
-            "scripts": {
-                "build": "echo 'Building...' && mkdir -p build && echo '<h1>Test App</h1>' > build/index.html"
-            },
-            "dependencies": {
-                "react": "^18.0.0"
-            }
-        }
-        
-        import json
-        with open('package.json', 'w') as f:
-            json.dump(package_json, f, indent=2)
-        
-        # Create .env file
-        with open('.env', 'w') as f:
-            f.write('REACT_APP_API_URL=https://api.example.com\n')
-            f.write('NODE_ENV=production\n')
+        (self.project_path / 'package.json').write_bytes(PACKAGE_JSON_BYTES)
+        (self.project_path / '.env').write_bytes(ENV_BYTES)
     
-    def test_cli_creation(self):
+    def test_cli_creation(self, cli_app):
         """Test CLI application creation."""
-        cli = create_cli("0.8.0")
-        assert cli is not None
+        assert cli_app is not None
         
         # Check that all commands are registered
-        command_names = [cmd.name for cmd in cli.commands.values()]
-        expected_commands = ['init', 'deploy', 'status', 'interactive', 'logs', 'config', 'history', 'rollback', 'auth', 'version']
-        
-        for cmd in expected_commands:
-            assert cmd in command_names, f"Command '{cmd}' not found in CLI"
+        expected_commands = {'init', 'deploy', 'status', 'interactive', 'logs', 'config', 'history', 'rollback', 'auth', 'version'}
+        missing = expected_commands - {cmd.name for cmd in cli_app.commands.values()}
+        assert not missing, f"Commands not found in CLI: {sorted(missing)}"
     
     def test_platform_factory(self):
         """Test platform factory functionality."""
         # Test available platforms
-        platforms = PlatformFactory.get_available_platforms()
-        expected_platforms = ['github', 'vercel', 'netlify', 'railway', 'render']
-        
-        for platform in expected_platforms:
-            assert platform in platforms, f"Platform '{platform}' not available"
+        expected_platforms = {'github', 'vercel', 'netlify', 'railway', 'render'}
+        missing = expected_platforms - set(PlatformFactory.get_available_platforms())
+        assert not missing, f"Platforms not available: {sorted(missing)}"
     
     @patch.dict(os.environ, {'GITHUB_TOKEN': 'test_token'})
     def test_github_platform_creation(self):
@@ -83,9 +92,8 @@ class TestFullApplication:
         platform = get_platform('github', config)
         
         assert platform is not None
-        assert hasattr(platform, 'validate_credentials')
-        assert hasattr(platform, 'execute_deployment')
-        assert hasattr(platform, 'get_deployment_status')
+        # Raises AttributeError naming the first missing method
+        attrgetter('validate_credentials', 'execute_deployment', 'get_deployment_status')(platform)
     
     @patch.dict(os.environ, {'VERCEL_TOKEN': 'test_token'})
     def test_vercel_platform_creation(self):
@@ -94,8 +102,7 @@ class TestFullApplication:
         platform = get_platform('vercel', config)
         
         assert platform is not None
-        assert hasattr(platform, 'validate_credentials')
-        assert hasattr(platform, 'execute_deployment')
+        attrgetter('validate_credentials', 'execute_deployment')(platform)
     
     def test_config_management(self):
         """Test configuration management."""
@@ -119,11 +126,8 @@ class TestFullApplication:
         assert loaded_config['project']['name'] == 'test-app'
         assert loaded_config['platform'] == 'github'
     
-    @patch('subprocess.run')
-    def test_project_detection(self, mock_run):
+    def test_project_detection(self, fake_subprocess):
         """Test project type detection."""
-        from detectors.project import ProjectDetector
-        
         detector = ProjectDetector(self.test_dir)
         project_info = detector.detect()
         
@@ -153,7 +157,7 @@ class TestFullApplication:
     @patch.dict(os.environ, {'GITHUB_TOKEN': 'test_token'})
     @patch('platforms.github.platform.GitHubPlatform.validate_credentials')
     @patch('platforms.github.platform.GitHubPlatform.execute_deployment')
-    def test_deployment_service(self, mock_deploy, mock_validate):
+    def test_deployment_service(self, mock_deploy, mock_validate, event_loop_runner, monkeypatch, deploy_project):
         """Test deployment service."""
         # Setup mocks
         mock_validate.return_value = (True, "Valid credentials")
@@ -172,26 +176,24 @@ class TestFullApplication:
             'github': {'repo': 'test/repo'}
         }
         
-        config = Config(self.test_dir)
-        config.save(config_data)
-        
-        # Create build directory
-        os.makedirs('build', exist_ok=True)
-        with open('build/index.html', 'w') as f:
-            f.write('<h1>Test App</h1>')
+        # Serve the config from memory instead of round-tripping it through YAML;
+        # build/index.html comes from the deploy_project fixture
+        monkeypatch.setattr('utils.config.Config.exists', lambda self: True)
+        monkeypatch.setattr('utils.config.Config.load', lambda self: config_data)
         
         # Test deployment
-        service = DeploymentService(self.test_dir)
+        service = DeploymentService(str(deploy_project))
         
-        # Use asyncio.run for async method
-        import asyncio
-        success, message = asyncio.run(service.deploy())
+        success, message = event_loop_runner(service.deploy())
         
         assert success
         assert "successful" in message.lower()
     
-    def test_auth_commands(self):
+    def test_auth_commands(self, monkeypatch):
         """Test authentication commands."""
+        # Token files are resolved against the working directory
+        monkeypatch.chdir(self.test_dir)
+        
         # Test auth status (should work without tokens)
         result = auth_status_command()
         assert result is True
@@ -203,24 +205,21 @@ class TestFullApplication:
     @patch('webbrowser.open')
     @patch('builtins.input', side_effect=['y', 'test_token'])
     @patch('requests.get')
-    def test_auth_setup_github(self, mock_get, mock_input, mock_browser):
+    def test_auth_setup_github(self, mock_get, mock_input, mock_browser, monkeypatch):
         """Test GitHub auth setup."""
+        monkeypatch.chdir(self.test_dir)
+        
         # Mock successful token validation
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {'login': 'testuser'}
-        mock_get.return_value = mock_response
+        mock_get.return_value = SimpleNamespace(status_code=200, json=lambda: {'login': 'testuser'})
         
         result = auth_setup_command('github')
         
         # Should open browser and save token
         mock_browser.assert_called_once()
-        assert Path('.deployx_github_token').exists()
+        assert Path('.deployx_github_token').read_bytes().strip() == b'test_token'
     
     def test_environment_variable_detection(self):
         """Test environment variable detection."""
-        from utils.env_manager import EnvManager
-        
         env_manager = EnvManager(self.test_dir)
         env_vars = env_manager.detect_env_files()
         
@@ -235,24 +234,19 @@ class TestFullApplication:
                 assert 'REACT_APP_API_URL' in variables
                 assert 'NODE_ENV' in variables
     
-    @patch('subprocess.run')
-    def test_build_process(self, mock_run):
+    def test_build_process(self, fake_subprocess):
         """Test build process execution."""
-        from utils.build import BuildManager
-        
         # Mock successful build
-        mock_run.return_value = MagicMock(returncode=0, stdout="Build successful")
+        fake_subprocess.results.append({'returncode': 0, 'stdout': "Build successful"})
         
         build_manager = BuildManager(self.test_dir)
         success, message = build_manager.execute_build('npm run build', 'build')
         
         assert success
-        mock_run.assert_called()
+        assert fake_subprocess.calls == [['npm', 'run', 'build']]
     
     def test_error_handling(self):
         """Test error handling throughout the application."""
-        from utils.errors import handle_auth_error, handle_build_error
-        
         # Test auth error handling
         auth_error = handle_auth_error('github', 'Invalid token')
         assert 'invalid token' in auth_error.message.lower()
@@ -264,8 +258,6 @@ class TestFullApplication:
     def test_platform_auto_creation(self):
         """Test platform auto-creation functionality."""
         # Test GitHub auto-creation
-        from platforms.github.auto_creation import GitHubAutoCreation
-        
         auto_creation = GitHubAutoCreation(None)  # No token
         should_create, reason = auto_creation.should_create_repository(self.test_dir)
         
@@ -275,9 +267,6 @@ class TestFullApplication:
     
     def test_cli_integration_detection(self):
         """Test CLI integration detection."""
-        from platforms.github.cli_integration import GitHubCLIIntegration
-        from platforms.vercel.cli_integration import VercelCLIIntegration
-        
         github_cli = GitHubCLIIntegration()
         vercel_cli = VercelCLIIntegration()
         
@@ -302,8 +291,6 @@ class TestFullApplication:
     
     def test_configuration_validation(self):
         """Test configuration validation."""
-        from utils.validator import validate_config
-        
         # Test valid config
         valid_config = {
             'project': {'name': 'test', 'type': 'react'},
@@ -325,45 +312,36 @@ class TestFullApplication:
     
     def test_modular_architecture(self):
         """Test that all platforms follow modular architecture."""
-        # Change to project root for proper path resolution
-        import os
-        original_cwd = os.getcwd()
-        project_root = Path(__file__).parent.parent
-        os.chdir(project_root)
-        
-        try:
-            platform_dirs = ['github', 'vercel', 'railway', 'netlify']
+        # Resolve platforms against the project root
+        project_root = Path(__file__).resolve().parent.parent
+        platform_dirs = ['github', 'vercel', 'railway', 'netlify']
+        required_files = {'__init__.py', 'platform.py'}
+        
+        # One directory listing per level instead of a stat per path
+        with os.scandir(project_root / 'platforms') as entries:
+            platform_paths = {entry.name: entry.path for entry in entries if entry.is_dir()}
+        
+        for platform_dir in platform_dirs:
+            # Check that platform directory exists
+            assert platform_dir in platform_paths, f"Platform directory {platform_dir} not found"
             
-            for platform_dir in platform_dirs:
-                platform_path = Path('platforms') / platform_dir
-                
-                # Check that platform directory exists
-                assert platform_path.exists(), f"Platform directory {platform_dir} not found"
-                
-                # Check for required files
-                required_files = ['__init__.py', 'platform.py']
-                for file_name in required_files:
-                    file_path = platform_path / file_name
-                    assert file_path.exists(), f"Required file {file_name} not found in {platform_dir}"
-        finally:
-            os.chdir(original_cwd)
+            # Check for required files
+            with os.scandir(platform_paths[platform_dir]) as entries:
+                files = {entry.name for entry in entries if entry.is_file()}
+            missing = required_files - files
+            assert not missing, f"Required files {sorted(missing)} not found in {platform_dir}"
     
-    def test_phase_2_features(self):
+    def test_phase_2_features(self, cli_app):
         """Test Phase 2 Smart Token Wizard features."""
         # Test that auth commands are available
-        cli = create_cli("0.8.0")
-        command_names = [cmd.name for cmd in cli.commands.values()]
-        assert 'auth' in command_names
+        assert 'auth' in {cmd.name for cmd in cli_app.commands.values()}
         
         # Test token file creation
-        token_file = Path('.deployx_github_token')
-        token_file.write_text('test_token')
-        
-        assert token_file.exists()
-        assert token_file.read_text() == 'test_token'
+        token_file = self.project_path / '.deployx_github_token'
+        token_file.write_bytes(b'test_token')
         
-        # Clean up
-        token_file.unlink()
+        # read_bytes raises if the file is missing; tmp_path cleans it up
+        assert token_file.read_bytes() == b'test_token'
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
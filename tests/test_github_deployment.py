@@ -1,44 +1,46 @@
 #!/usr/bin/env python3
 
+import functools
 import unittest
-import tempfile
 import shutil
-from pathlib import Path
-from unittest.mock import patch, MagicMock
+import pytest
+from unittest.mock import MagicMock
 from platforms.github.platform import GitHubPlatform
 from core.models import DeployXConfig
 
 
+@functools.cache
+def _github_config() -> DeployXConfig:
+    """Validated GitHub test config, built once; tests must not mutate it."""
+    return DeployXConfig(
+        project={'name': 'test-app', 'type': 'react'},
+        build={'command': 'npm run build', 'output': 'build'},
+        platform='github',
+        github={'repo': 'testuser/testrepo', 'method': 'branch', 'branch': 'gh-pages'}
+    )
+
+
 class TestGitHubDeployment(unittest.TestCase):
     """Test GitHub platform deployment functionality."""
     
-    def setUp(self):
+    @pytest.fixture(autouse=True)
+    def _setup(self, deploy_project):
         """Set up test environment."""
-        self.test_dir = tempfile.mkdtemp()
-        self.project_path = Path(self.test_dir)
-        
-        # Create test config
-        self.config = DeployXConfig(
-            project={'name': 'test-app', 'type': 'react'},
-            build={'command': 'npm run build', 'output': 'build'},
-            platform='github',
-            github={'repo': 'testuser/testrepo', 'method': 'branch', 'branch': 'gh-pages'}
-        )
+        self.test_dir = str(deploy_project)
+        self.project_path = deploy_project
         
-        # Create test files
-        (self.project_path / 'build').mkdir()
-        (self.project_path / 'build' / 'index.html').write_text('<html><body>Test</body></html>')
-        
-    def tearDown(self):
-        """Clean up test environment."""
-        shutil.rmtree(self.test_dir)
+        self.config = _github_config()
+    
+    @pytest.fixture(autouse=True)
+    def _mock_github(self, monkeypatch):
+        """Replace the PyGithub client for every test in the class."""
+        self.mock_github = MagicMock()
+        monkeypatch.setattr('platforms.github.platform.Github', self.mock_github)
     
-    @patch('platforms.github.platform.Github')
-    def test_github_deployment_success(self, mock_github):
+    def test_github_deployment_success(self):
         """Test successful GitHub deployment."""
         # Mock GitHub API
-        mock_repo = MagicMock()
-        mock_github.return_value.get_repo.return_value = mock_repo
+        self.mock_github.return_value.get_repo.return_value = MagicMock()
         
         platform = GitHubPlatform(self.config, str(self.project_path))
         platform.token = 'test_token'
@@ -48,10 +50,9 @@ class TestGitHubDeployment(unittest.TestCase):
         self.assertTrue(success)
         self.assertIn('deployed', message.lower())
     
-    @patch('platforms.github.platform.Github')
-    def test_github_deployment_auth_failure(self, mock_github):
+    def test_github_deployment_auth_failure(self):
         """Test GitHub deployment with authentication failure."""
-        mock_github.side_effect = Exception("Bad credentials")
+        self.mock_github.side_effect = Exception("Bad credentials")
         
         platform = GitHubPlatform(self.config, str(self.project_path))
         platform.token = 'invalid_token'
@@ -1,7 +1,6 @@
 import unittest
 import os
 import tempfile
-import shutil
 from unittest.mock import Mock, patch
 from pathlib import Path
 import sys
@@ -27,7 +26,9 @@ class TestGitHubPlatform(unittest.TestCase):
         os.environ['GITHUB_TOKEN'] = 'fake_github_token_12345'
         
         # Create temporary project directory
-        self.temp_dir = tempfile.mkdtemp()
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_dir = temp_dir.name
         self.project_path = Path(self.temp_dir)
         
         # Create fake build output
@@ -38,7 +39,6 @@ class TestGitHubPlatform(unittest.TestCase):
     
     def tearDown(self):
         """Clean up test environment"""
-        shutil.rmtree(self.temp_dir)
         if 'GITHUB_TOKEN' in os.environ:
             del os.environ['GITHUB_TOKEN']
     
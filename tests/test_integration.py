@@ -1,6 +1,5 @@
 import unittest
 import tempfile
-import shutil
 import json
 from pathlib import Path
 from unittest.mock import Mock, patch
@@ -18,7 +17,9 @@ from platforms.base import DeploymentResult, DeploymentStatus
 class TestIntegration(unittest.TestCase):
     
     def setUp(self):
-        self.temp_dir = tempfile.mkdtemp()
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_dir = temp_dir.name
         self.project_path = Path(self.temp_dir)
         
         # Create a mock React project
@@ -28,7 +29,6 @@ class TestIntegration(unittest.TestCase):
         os.environ['GITHUB_TOKEN'] = 'fake_token_123'
     
     def tearDown(self):
-        shutil.rmtree(self.temp_dir)
         if 'GITHUB_TOKEN' in os.environ:
             del os.environ['GITHUB_TOKEN']
     
@@ -150,12 +150,11 @@ class TestIntegration(unittest.TestCase):
 class TestErrorScenarios(unittest.TestCase):
     
     def setUp(self):
-        self.temp_dir = tempfile.mkdtemp()
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_dir = temp_dir.name
         self.project_path = Path(self.temp_dir)
     
-    def tearDown(self):
-        shutil.rmtree(self.temp_dir)
-    
     def test_init_no_project_files(self):
         """Test init with empty directory"""
         init_command(str(self.project_path))
@@ -236,12 +235,11 @@ class TestErrorScenarios(unittest.TestCase):
 class TestEdgeCases(unittest.TestCase):
     
     def setUp(self):
-        self.temp_dir = tempfile.mkdtemp()
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_dir = temp_dir.name
         self.project_path = Path(self.temp_dir)
     
-    def tearDown(self):
-        shutil.rmtree(self.temp_dir)
-    
     def test_empty_repository(self):
         """Test with empty git repository"""
         # Initialize empty git repo
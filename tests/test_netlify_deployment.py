@@ -1,42 +1,39 @@
 #!/usr/bin/env python3
 
+import functools
 import unittest
-import tempfile
-import shutil
-from pathlib import Path
-from unittest.mock import patch, MagicMock
+import pytest
+from unittest.mock import patch
 from platforms.netlify.platform import NetlifyPlatform
 from core.models import DeployXConfig
 
 
+@functools.cache
+def _netlify_config() -> DeployXConfig:
+    """Validated Netlify test config, built once; tests must not mutate it."""
+    return DeployXConfig(
+        project={'name': 'test-app', 'type': 'react'},
+        build={'command': 'npm run build', 'output': 'build'},
+        platform='netlify',
+        netlify={'site_id': 'test-site-id'}
+    )
+
+
 class TestNetlifyDeployment(unittest.TestCase):
     """Test Netlify platform deployment functionality."""
     
-    def setUp(self):
+    @pytest.fixture(autouse=True)
+    def _setup(self, deploy_project, fake_subprocess):
         """Set up test environment."""
-        self.test_dir = tempfile.mkdtemp()
-        self.project_path = Path(self.test_dir)
-        
-        # Create test config
-        self.config = DeployXConfig(
-            project={'name': 'test-app', 'type': 'react'},
-            build={'command': 'npm run build', 'output': 'build'},
-            platform='netlify',
-            netlify={'site_id': 'test-site-id'}
-        )
-        
-        # Create test files
-        (self.project_path / 'build').mkdir()
-        (self.project_path / 'build' / 'index.html').write_text('<html><body>Test</body></html>')
+        self.test_dir = str(deploy_project)
+        self.project_path = deploy_project
+        self.run = fake_subprocess
         
-    def tearDown(self):
-        """Clean up test environment."""
-        shutil.rmtree(self.test_dir)
+        self.config = _netlify_config()
     
-    @patch('subprocess.run')
-    def test_netlify_cli_deployment_success(self, mock_run):
+    def test_netlify_cli_deployment_success(self):
         """Test successful Netlify CLI deployment."""
-        mock_run.return_value = MagicMock(returncode=0, stdout='https://test-app.netlify.app')
+        self.run.results.append({'returncode': 0, 'stdout': 'https://test-app.netlify.app'})
         
         platform = NetlifyPlatform(self.config, str(self.project_path))
         
@@ -45,10 +42,9 @@ class TestNetlifyDeployment(unittest.TestCase):
         self.assertTrue(success)
         self.assertIn('deployed', message.lower())
     
-    @patch('subprocess.run')
-    def test_netlify_cli_deployment_failure(self, mock_run):
+    def test_netlify_cli_deployment_failure(self):
         """Test Netlify CLI deployment failure."""
-        mock_run.return_value = MagicMock(returncode=1, stderr='Authentication failed')
+        self.run.results.append({'returncode': 1, 'stderr': 'Authentication failed'})
         
         platform = NetlifyPlatform(self.config, str(self.project_path))
         
@@ -2,61 +2,77 @@
 Tests for Phase 2 Smart Token Wizard features.
 """
 import os
-import tempfile
-import shutil
+import signal
+import subprocess
+import sys
 from pathlib import Path
 import pytest
+from subprocess import CompletedProcess
 from unittest.mock import patch, MagicMock
 
-from commands.auth import auth_status_command, auth_setup_command, auth_clear_command
+from commands.auth import TOKEN_FILES, auth_status_command, auth_setup_command, auth_clear_command, _test_platform_token
 from platforms.github.auto_creation import GitHubAutoCreation
 from platforms.vercel.auto_creation import VercelAutoCreation
 from platforms.railway.auto_creation import RailwayAutoCreation
 from platforms.netlify.auto_creation import NetlifyAutoCreation
+from platforms.github.cli_integration import GitHubCLIIntegration
+from platforms.vercel.cli_integration import VercelCLIIntegration
+from platforms.railway.cli_integration import RailwayCLIIntegration
+from platforms.netlify.cli_integration import NetlifyCLIIntegration
+from platforms.github.platform import GitHubPlatform
+from platforms._http import get_session
+from platforms._process import run_cli
+
+def _answers(*replies):
+    """input() stand-in that returns replies in order, ignoring the prompt."""
+    replies = iter(replies)
+    return lambda prompt: next(replies)
+
+def _interrupt(prompt):
+    """input() stand-in for a user pressing Ctrl+C."""
+    raise KeyboardInterrupt
+
+@pytest.fixture(scope='module')
+def github_auto_creation():
+    """Stateless GitHubAutoCreation shared by the name-generation cases."""
+    return GitHubAutoCreation(None)
 
 class TestPhase2Features:
     """Test Phase 2 Smart Token Wizard and auto-creation features."""
     
-    def setup_method(self):
-        """Set up test environment."""
-        self.test_dir = tempfile.mkdtemp()
-        self.original_cwd = os.getcwd()
-        os.chdir(self.test_dir)
-    
-    def teardown_method(self):
-        """Clean up test environment."""
-        os.chdir(self.original_cwd)
-        shutil.rmtree(self.test_dir)
+    @pytest.fixture(autouse=True)
+    def _cwd(self, tmp_path, monkeypatch):
+        """Run each test inside its own temporary project directory."""
+        monkeypatch.chdir(tmp_path)
+        self.test_dir = str(tmp_path)
     
     def test_auth_status_command(self):
         """Test auth status command."""
         result = auth_status_command()
         assert result is True
     
-    @patch('webbrowser.open')
-    @patch('builtins.input', side_effect=['y', 'test_token'])
     @patch('commands.auth._test_platform_token', return_value=True)
-    def test_auth_setup_github(self, mock_test, mock_input, mock_browser):
+    def test_auth_setup_github(self, mock_test):
         """Test GitHub auth setup."""
-        result = auth_setup_command('github')
+        opened = []
+        result = auth_setup_command('github', input_fn=_answers('y', 'test_token'), opener=opened.append)
         
         assert result is True
-        mock_browser.assert_called_once()
+        assert len(opened) == 1
         
         # Check token file was created
         token_file = Path('.deployx_github_token')
         assert token_file.exists()
         assert token_file.read_text().strip() == 'test_token'
     
-    @patch('webbrowser.open')
-    @patch('builtins.input', side_effect=['y', 'test_token'])
     @patch('commands.auth._test_platform_token', return_value=True)
-    def test_auth_setup_vercel(self, mock_test, mock_input, mock_browser):
+    def test_auth_setup_vercel(self, mock_test):
         """Test Vercel auth setup."""
-        result = auth_setup_command('vercel')
+        opened = []
+        result = auth_setup_command('vercel', input_fn=_answers('y', 'test_token'), opener=opened.append)
         
         assert result is True
-        mock_browser.assert_called_once()
+        assert len(opened) == 1
         
         # Check token file was created
         token_file = Path('.deployx_vercel_token')
@@ -79,14 +95,13 @@ class TestPhase2Features:
         result = auth_setup_command('invalid_platform')
         assert result is False
     
-    @patch('builtins.input', side_effect=['n'])
-    def test_auth_setup_cancelled(self, mock_input):
+    def test_auth_setup_cancelled(self):
         """Test auth setup when user cancels."""
         # Create existing token
         token_file = Path('.deployx_github_token')
         token_file.write_text('existing_token')
         
-        result = auth_setup_command('github')
+        result = auth_setup_command('github', input_fn=_answers('n'))
         
         # Should return True (existing config kept)
         assert result is True
@@ -98,15 +113,15 @@ class TestPhase2Features:
         auto_creation = GitHubAutoCreation(None)
         
         # Mock git status to return failure (no git repo)
-        mock_run.return_value = MagicMock(returncode=1)
+        mock_run.return_value = CompletedProcess(args=[], returncode=1, stdout='', stderr='')
         should_create, reason = auto_creation.should_create_repository(self.test_dir)
         assert should_create
         assert 'no git repository' in reason.lower()
         
         # Mock git status success but no remote
         mock_run.side_effect = [
-            MagicMock(returncode=0),  # git status succeeds
-            MagicMock(returncode=0, stdout="")  # git remote -v returns empty
+            CompletedProcess(args=[], returncode=0, stdout='', stderr=''),  # git status succeeds
+            CompletedProcess(args=[], returncode=0, stdout="", stderr="")  # git remote -v returns empty
         ]
         should_create, reason = auto_creation.should_create_repository(self.test_dir)
         assert should_create
@@ -157,8 +172,7 @@ class TestPhase2Features:
         assert not should_create
         assert 'already configured' in reason.lower()
     
-    @patch('builtins.input', return_value='my-custom-name')
-    def test_project_name_prompts(self, mock_input):
+    def test_project_name_prompts(self):
         """Test project name prompting."""
         auto_creation = GitHubAutoCreation(None)
         
@@ -167,101 +181,114 @@ class TestPhase2Features:
         assert suggested == 'my-test-project'
         
         # Test custom name input
-        custom_name = auto_creation._prompt_for_repo_name('suggested-name')
+        custom_name = auto_creation._prompt_for_repo_name('suggested-name', input_fn=lambda prompt: 'my-custom-name')
         assert custom_name == 'my-custom-name'
     
-    @patch('subprocess.run')
-    def test_cli_integrations(self, mock_run):
+    @pytest.mark.parametrize('cli_cls', [GitHubCLIIntegration, VercelCLIIntegration, RailwayCLIIntegration, NetlifyCLIIntegration])
+    @pytest.mark.parametrize('returncode,expected', [(1, False), (0, True)])
+    def test_cli_integrations(self, cli_cls, returncode, expected):
         """Test CLI integrations."""
-        from platforms.github.cli_integration import GitHubCLIIntegration
-        from platforms.vercel.cli_integration import VercelCLIIntegration
-        from platforms.railway.cli_integration import RailwayCLIIntegration
-        from platforms.netlify.cli_integration import NetlifyCLIIntegration
-        
-        # Mock CLI not available
-        mock_run.return_value = MagicMock(returncode=1)
+        result = CompletedProcess(args=[], returncode=returncode, stdout="Logged in", stderr="")
+        with patch('subprocess.run', return_value=result), \
+             patch('platforms.vercel.cli_integration.run_cli', return_value=result), \
+             patch('platforms.railway.cli_integration.run_cli', return_value=result):
+            assert cli_cls().is_cli_available() is expected
+    
+    @pytest.mark.parametrize('cli_cls', [VercelCLIIntegration, RailwayCLIIntegration])
+    def test_cli_timeouts(self, cli_cls, monkeypatch):
+        """Test hung CLI processes fail cleanly instead of blocking."""
+        mock_run = MagicMock(side_effect=subprocess.TimeoutExpired(cmd="up", timeout=600, output="Uploading..."))
+        monkeypatch.setattr(f'{cli_cls.__module__}.run_cli', mock_run)
         
-        github_cli = GitHubCLIIntegration()
-        vercel_cli = VercelCLIIntegration()
-        railway_cli = RailwayCLIIntegration()
-        netlify_cli = NetlifyCLIIntegration()
+        cli = cli_cls()
+        assert not cli.is_cli_available()
+        success, message, url = cli.deploy_project()
+        assert success is False
+        assert 'timed out' in message
+        assert url is None
+    
+    def test_run_cli_kills_process_group(self):
+        """Test a timed-out CLI takes its spawned children down with it."""
+        with patch('platforms._process.subprocess.Popen') as mock_popen, \
+             patch('platforms._process.os.killpg') as mock_killpg:
+            process = mock_popen.return_value.__enter__.return_value
+            process.pid = 4321
+            process.communicate.side_effect = subprocess.TimeoutExpired(cmd="up", timeout=1)
+            
+            with pytest.raises(subprocess.TimeoutExpired):
+                run_cli(["vercel", "--prod"], timeout=1, capture_output=True)
         
-        assert not github_cli.is_cli_available()
-        assert not vercel_cli.is_cli_available()
-        assert not railway_cli.is_cli_available()
-        assert not netlify_cli.is_cli_available()
+        assert mock_popen.call_args.kwargs['start_new_session'] is True
+        mock_killpg.assert_called_once_with(4321, signal.SIGKILL)
+        process.wait.assert_called_once()
+    
+    def test_run_cli_returns_output(self):
+        """Test run_cli hands back output like subprocess.run."""
+        result = run_cli([sys.executable, "-c", "print('ok')"], timeout=30, capture_output=True, text=True)
+        assert result.returncode == 0
+        assert result.stdout.strip() == 'ok'
+    
+    def test_run_cli_input_and_check(self):
+        """Test run_cli feeds input to the command and honours check."""
+        echo = [sys.executable, "-c", "import sys; print(sys.stdin.read().upper())"]
+        result = run_cli(echo, timeout=30, input="y\n", capture_output=True, text=True)
+        assert result.stdout.strip() == 'Y'
         
-        # Mock CLI available
-        mock_run.return_value = MagicMock(returncode=0, stdout="Logged in")
+        with pytest.raises(subprocess.CalledProcessError):
+            run_cli([sys.executable, "-c", "raise SystemExit(3)"], timeout=30, check=True)
+    
+    def test_railway_create_project_confirms(self, monkeypatch):
+        """Test Railway project creation answers the CLI's confirmation prompt."""
+        real_popen = subprocess.Popen
+        confirm = [sys.executable, "-c", "import sys; sys.exit(sys.stdin.read() != 'y\\n')"]
+        monkeypatch.setattr('platforms._process.subprocess.Popen', lambda args, **kwargs: real_popen(confirm, **kwargs))
         
-        assert github_cli.is_cli_available()
-        assert vercel_cli.is_cli_available()
-        assert railway_cli.is_cli_available()
-        assert netlify_cli.is_cli_available()
+        success, message = RailwayCLIIntegration().create_project('my-app', self.test_dir)
+        assert success, message
     
-    @patch('requests.get')
-    def test_token_validation(self, mock_get):
+    @pytest.mark.parametrize('platform,status_code,expected', [
+        ('netlify', 200, True),
+        ('render', 200, True),
+        ('netlify', 401, False),
+    ])
+    def test_token_validation(self, platform, status_code, expected):
         """Test token validation for all platforms."""
-        from commands.auth import _test_platform_token
-        
-        # Mock successful API responses
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_get.return_value = mock_response
-        
-        # Test all platforms
-        platforms = ['netlify', 'render']
-        for platform in platforms:
-            result = _test_platform_token(platform, 'test_token')
-            assert result is True
-        
-        # Test failed validation
-        mock_response.status_code = 401
-        result = _test_platform_token('netlify', 'invalid_token')
-        assert result is False
+        # Validation goes through the shared keep-alive session
+        with patch.object(get_session(), 'get', return_value=MagicMock(status_code=status_code)):
+            assert _test_platform_token(platform, 'test_token') is expected
     
-    def test_token_file_management(self):
+    @pytest.mark.parametrize('platform', ['github', 'vercel', 'railway', 'netlify', 'render'])
+    def test_token_file_management(self, platform):
         """Test token file creation and management."""
-        platforms = ['github', 'vercel', 'railway', 'netlify', 'render']
+        token_file = TOKEN_FILES[platform]
         
-        for platform in platforms:
-            token_file = Path(f'.deployx_{platform}_token')
-            
-            # Create token file
-            token_file.write_text('test_token')
-            assert token_file.exists()
-            
-            # Clear token file
-            result = auth_clear_command(platform)
-            assert result is True
-            assert not token_file.exists()
+        # Create token file
+        token_file.write_text('test_token')
+        assert token_file.exists()
+        
+        # Clear token file
+        result = auth_clear_command(platform)
+        assert result is True
+        assert not token_file.exists()
     
-    @patch('builtins.input', side_effect=KeyboardInterrupt())
-    def test_setup_cancellation(self, mock_input):
+    def test_setup_cancellation(self):
         """Test setup cancellation handling."""
-        result = auth_setup_command('github')
+        result = auth_setup_command('github', input_fn=_interrupt)
         assert result is False
     
-    def test_suggested_name_generation(self):
+    @pytest.mark.parametrize('input_name,expected', [
+        ('My Test Project', 'my-test-project'),
+        ('test_app_name', 'test-app-name'),
+        ('TestApp123', 'testapp123'),
+        ('app with spaces', 'app-with-spaces'),
+        ('', 'my-project'),  # Fallback for empty names
+    ])
+    def test_suggested_name_generation(self, github_auto_creation, input_name, expected):
         """Test suggested name generation for all platforms."""
-        test_cases = [
-            ('My Test Project', 'my-test-project'),
-            ('test_app_name', 'test-app-name'),
-            ('TestApp123', 'testapp123'),
-            ('app with spaces', 'app-with-spaces'),
-            ('', 'my-project'),  # Fallback for empty names
-        ]
-        
-        auto_creation = GitHubAutoCreation(None)
-        
-        for input_name, expected in test_cases:
-            result = auto_creation._generate_suggested_name(input_name)
-            assert result == expected
+        assert github_auto_creation._generate_suggested_name(input_name) == expected
     
     def test_hybrid_authentication_priority(self):
         """Test hybrid authentication priority order."""
-        from platforms.github.platform import GitHubPlatform
-        
         # Test priority: CLI > Token file > Environment
         with patch.dict(os.environ, {'GITHUB_TOKEN': 'env_token'}):
             # Create token file
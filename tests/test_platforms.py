@@ -59,4 +59,17 @@ def test_invalid_platform():
     config = {"project": {"name": "test"}}
     
     with pytest.raises(ValueError, match="Unknown platform"):
-        PlatformFactory.create_platform("invalid", config)
\ No newline at end of file
+        PlatformFactory.create_platform("invalid", config)
+
+def test_railway_token_assignment_rebuilds_components(tmp_path, monkeypatch):
+    """Test assigning a Railway token replaces clients cached for the old one"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv('RAILWAY_TOKEN', raising=False)
+    monkeypatch.setattr('platforms.railway.platform.RailwayCLIIntegration.is_cli_available', lambda self: False)
+    
+    platform = RailwayPlatform({'railway': {}})
+    assert platform.api_integration is None
+    
+    platform.token = 'new_token'
+    assert platform.api_integration.token == 'new_token'
+    assert platform.auto_creation is not None
@@ -1,6 +1,5 @@
 import unittest
 import tempfile
-import shutil
 import json
 from pathlib import Path
 import sys
@@ -13,12 +12,11 @@ from detectors.project import detect_project, get_project_summary
 class TestProjectDetection(unittest.TestCase):
     
     def setUp(self):
-        self.temp_dir = tempfile.mkdtemp()
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_dir = temp_dir.name
         self.project_path = Path(self.temp_dir)
     
-    def tearDown(self):
-        shutil.rmtree(self.temp_dir)
-    
     def test_detect_react_project(self):
         """Test detection of React project"""
         # Create package.json with React
@@ -1,42 +1,40 @@
 #!/usr/bin/env python3
 
+import functools
 import unittest
-import tempfile
-import shutil
-from pathlib import Path
-from unittest.mock import patch, MagicMock
+import pytest
+from subprocess import CompletedProcess
+from unittest.mock import patch
 from platforms.railway.platform import RailwayPlatform
 from core.models import DeployXConfig
 
 
+@functools.cache
+def _railway_config() -> DeployXConfig:
+    """Validated Railway test config, built once; tests must not mutate it."""
+    return DeployXConfig(
+        project={'name': 'test-app', 'type': 'nodejs'},
+        build={'command': 'npm run build', 'output': 'build'},
+        platform='railway',
+        railway={'project_id': 'test-project-id', 'service_id': 'test-service-id'}
+    )
+
+
 class TestRailwayDeployment(unittest.TestCase):
     """Test Railway platform deployment functionality."""
     
-    def setUp(self):
+    @pytest.fixture(autouse=True)
+    def _setup(self, shared_deploy_project):
         """Set up test environment."""
-        self.test_dir = tempfile.mkdtemp()
-        self.project_path = Path(self.test_dir)
-        
-        # Create test config
-        self.config = DeployXConfig(
-            project={'name': 'test-app', 'type': 'nodejs'},
-            build={'command': 'npm run build', 'output': 'build'},
-            platform='railway',
-            railway={'project_id': 'test-project-id', 'service_id': 'test-service-id'}
-        )
-        
-        # Create test files
-        (self.project_path / 'build').mkdir()
-        (self.project_path / 'build' / 'index.html').write_text('<html><body>Test</body></html>')
+        self.test_dir = str(shared_deploy_project)
+        self.project_path = shared_deploy_project
         
-    def tearDown(self):
-        """Clean up test environment."""
-        shutil.rmtree(self.test_dir)
+        self.config = _railway_config()
     
-    @patch('subprocess.run')
+    @patch('platforms.railway.cli_integration.run_cli')
     def test_railway_cli_deployment_success(self, mock_run):
         """Test successful Railway CLI deployment."""
-        mock_run.return_value = MagicMock(returncode=0, stdout='Deployment successful')
+        mock_run.return_value = CompletedProcess(args=[], returncode=0, stdout='Deployment successful', stderr='')
         
         platform = RailwayPlatform(self.config, str(self.project_path))
         
@@ -45,10 +43,10 @@ class TestRailwayDeployment(unittest.TestCase):
         self.assertTrue(success)
         self.assertIn('deployed', message.lower())
     
-    @patch('subprocess.run')
+    @patch('platforms.railway.cli_integration.run_cli')
     def test_railway_cli_deployment_failure(self, mock_run):
         """Test Railway CLI deployment failure."""
-        mock_run.return_value = MagicMock(returncode=1, stderr='Authentication failed')
+        mock_run.return_value = CompletedProcess(args=[], returncode=1, stdout='', stderr='Authentication failed')
         
         platform = RailwayPlatform(self.config, str(self.project_path))
         
@@ -1,37 +1,34 @@
 #!/usr/bin/env python3
 
+import functools
 import unittest
-import tempfile
-import shutil
-from pathlib import Path
+import pytest
 from unittest.mock import patch, MagicMock
 from platforms.render.platform import RenderPlatform
-from core.models import DeploymentConfig
+from core.models import DeployXConfig
+
+
+@functools.cache
+def _render_config() -> DeployXConfig:
+    """Validated Render test config, built once; tests must not mutate it."""
+    return DeployXConfig(
+        project={'name': 'test-app', 'type': 'static'},
+        build={'command': 'npm run build', 'output': 'build'},
+        platform='render',
+        render={'service_id': 'test-service-id'}
+    )
 
 
 class TestRenderDeployment(unittest.TestCase):
     """Test Render platform deployment functionality."""
     
-    def setUp(self):
+    @pytest.fixture(autouse=True)
+    def _setup(self, shared_deploy_project):
         """Set up test environment."""
-        self.test_dir = tempfile.mkdtemp()
-        self.project_path = Path(self.test_dir)
-        
-        # Create test config
-        self.config = DeploymentConfig(
-            project={'name': 'test-app', 'type': 'static'},
-            build={'command': 'npm run build', 'output': 'build'},
-            platform='render',
-            render={'service_id': 'test-service-id'}
-        )
-        
-        # Create test files
-        (self.project_path / 'build').mkdir()
-        (self.project_path / 'build' / 'index.html').write_text('<html><body>Test</body></html>')
+        self.test_dir = str(shared_deploy_project)
+        self.project_path = shared_deploy_project
         
-    def tearDown(self):
-        """Clean up test environment."""
-        shutil.rmtree(self.test_dir)
+        self.config = _render_config()
     
     @patch('platforms.render.api_integration.RenderAPIIntegration.create_service')
     def test_render_service_creation_success(self, mock_create):
@@ -1,42 +1,40 @@
 #!/usr/bin/env python3
 
+import functools
 import unittest
-import tempfile
-import shutil
-from pathlib import Path
-from unittest.mock import patch, MagicMock
+import pytest
+from subprocess import CompletedProcess
+from unittest.mock import patch
 from platforms.vercel.platform import VercelPlatform
 from core.models import DeployXConfig
 
 
+@functools.cache
+def _vercel_config() -> DeployXConfig:
+    """Validated Vercel test config, built once; tests must not mutate it."""
+    return DeployXConfig(
+        project={'name': 'test-app', 'type': 'react'},
+        build={'command': 'npm run build', 'output': 'build'},
+        platform='vercel',
+        vercel={'project_name': 'test-app'}
+    )
+
+
 class TestVercelDeployment(unittest.TestCase):
     """Test Vercel platform deployment functionality."""
     
-    def setUp(self):
+    @pytest.fixture(autouse=True)
+    def _setup(self, shared_deploy_project):
         """Set up test environment."""
-        self.test_dir = tempfile.mkdtemp()
-        self.project_path = Path(self.test_dir)
-        
-        # Create test config
-        self.config = DeployXConfig(
-            project={'name': 'test-app', 'type': 'react'},
-            build={'command': 'npm run build', 'output': 'build'},
-            platform='vercel',
-            vercel={'project_name': 'test-app'}
-        )
-        
-        # Create test files
-        (self.project_path / 'build').mkdir()
-        (self.project_path / 'build' / 'index.html').write_text('<html><body>Test</body></html>')
+        self.test_dir = str(shared_deploy_project)
+        self.project_path = shared_deploy_project
         
-    def tearDown(self):
-        """Clean up test environment."""
-        shutil.rmtree(self.test_dir)
+        self.config = _vercel_config()
     
-    @patch('subprocess.run')
+    @patch('platforms.vercel.cli_integration.run_cli')
     def test_vercel_cli_deployment_success(self, mock_run):
         """Test successful Vercel CLI deployment."""
-        mock_run.return_value = MagicMock(returncode=0, stdout='https://test-app.vercel.app')
+        mock_run.return_value = CompletedProcess(args=[], returncode=0, stdout='https://test-app.vercel.app', stderr='')
         
         platform = VercelPlatform(self.config, str(self.project_path))
         
@@ -45,10 +43,10 @@ class TestVercelDeployment(unittest.TestCase):
         self.assertTrue(success)
         self.assertIn('deployed', message.lower())
     
-    @patch('subprocess.run')
+    @patch('platforms.vercel.cli_integration.run_cli')
     def test_vercel_cli_deployment_failure(self, mock_run):
         """Test Vercel CLI deployment failure."""
-        mock_run.return_value = MagicMock(returncode=1, stderr='Authentication failed')
+        mock_run.return_value = CompletedProcess(args=[], returncode=1, stdout='', stderr='Authentication failed')
         
         platform = VercelPlatform(self.config, str(self.project_path))
         
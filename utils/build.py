@@ -1,11 +1,23 @@
 """
 Build management utilities.
 """
+import functools
+import os
+import shlex
 import subprocess
+import tempfile
 from typing import Tuple
 from pathlib import Path
 from core.logging import get_logger
 
+# Trailing stderr reported when a build fails; bundler errors come last
+ERROR_TAIL_BYTES = 16 * 1024
+
+@functools.lru_cache(maxsize=64)
+def _parse_cmd(command: str) -> Tuple[str, ...]:
+    """Split a build command into argv, honoring shell-style quoting."""
+    return tuple(shlex.split(command))
+
 class BuildManager:
     """Manages build processes."""
     
@@ -16,17 +28,23 @@ class BuildManager:
     def execute_build(self, build_command: str, output_dir: str) -> Tuple[bool, str]:
         """Execute build command."""
         try:
-            result = subprocess.run(
-                build_command.split(),
-                cwd=self.project_path,
-                capture_output=True,
-                text=True
-            )
-            
-            if result.returncode == 0:
-                return True, "Build successful"
-            else:
-                return False, f"Build failed: {result.stderr}"
+            # stdout is never reported, and stderr goes to a temp file rather
+            # than memory so verbose builds cannot balloon the process
+            with tempfile.TemporaryFile() as stderr:
+                result = subprocess.run(
+                    list(_parse_cmd(build_command)),
+                    cwd=self.project_path,
+                    stdout=subprocess.DEVNULL,
+                    stderr=stderr
+                )
+                
+                if result.returncode == 0:
+                    return True, "Build successful"
+                
+                size = stderr.seek(0, os.SEEK_END)
+                stderr.seek(max(0, size - ERROR_TAIL_BYTES))
+                tail = stderr.read().decode(errors='replace')
+                return False, f"Build failed: {tail}"
                 
         except Exception as e:
             return False, f"Build error: {str(e)}"
@@ -6,14 +6,20 @@ configuration files. It provides a simple interface for accessing
 project and platform-specific settings.
 """
 
+import copy
 import yaml
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 from core.logging import get_logger
 
 CONFIG_FILE = "deployx.yml"
 logger = get_logger(__name__)
 
+# libyaml's C parser and emitter when PyYAML was built with them, else the
+# pure-Python ones
+SafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+SafeDumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
 
 class Config:
     """
@@ -28,6 +34,10 @@ class Config:
         _data: Cached configuration data (empty dict if not loaded)
     """
     
+    # Parsed files shared by every instance, keyed by absolute path and
+    # validated against the file's (mtime_ns, size) on each load
+    _cache: Dict[Path, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+    
     def __init__(self, project_path: str = "."):
         """
         Initialize configuration manager.
@@ -40,31 +50,53 @@ class Config:
         self._data = {}
         self.logger = get_logger(f"{__name__}.{self.__class__.__name__}")
     
-    def load(self) -> Dict[str, Any]:
+    def _parsed(self) -> Dict[str, Any]:
         """
-        Load configuration from deployx.yml file.
+        Return the shared parse of deployx.yml, re-reading it only once its
+        modification time or size changes.
         
-        Caches the loaded data for subsequent access. Returns empty
-        dict if file doesn't exist.
-        
-        Returns:
-            Dict containing configuration data
-        
-        Raises:
-            yaml.YAMLError: If configuration file is malformed
+        The returned dict is shared by every instance and must not be
+        mutated; load() and get() hand out copies.
         """
-        if not self.config_path.exists():
+        try:
+            stat = self.config_path.stat()
+        except FileNotFoundError:
             self.logger.debug("Configuration file does not exist")
             return {}
         
+        key = self.config_path.absolute()
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = Config._cache.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        
         try:
             with open(self.config_path, 'r') as f:
-                self._data = yaml.safe_load(f) or {}
-            self.logger.debug(f"Loaded configuration with {len(self._data)} keys")
-            return self._data
+                data = yaml.load(f, Loader=SafeLoader) or {}
         except yaml.YAMLError as e:
             self.logger.error(f"Failed to parse configuration file: {e}")
             raise
+        
+        Config._cache[key] = (signature, data)
+        self.logger.debug(f"Loaded configuration with {len(data)} keys")
+        return data
+    
+    def load(self) -> Dict[str, Any]:
+        """
+        Load configuration from deployx.yml file.
+        
+        Caches the loaded data for subsequent access. The parse is shared
+        across instances, but each call returns a private copy the caller
+        may modify. Returns empty dict if file doesn't exist.
+        
+        Returns:
+            Dict containing configuration data
+        
+        Raises:
+            yaml.YAMLError: If configuration file is malformed
+        """
+        self._data = copy.deepcopy(self._parsed())
+        return self._data
     
     def save(self, data: Dict[str, Any]) -> None:
         """
@@ -82,7 +114,11 @@ class Config:
         try:
             self._data = data
             with open(self.config_path, 'w') as f:
-                yaml.dump(data, f, default_flow_style=False, indent=2)
+                yaml.dump(data, f, Dumper=SafeDumper, default_flow_style=False, indent=2)
+            # Record what was written so a save within the filesystem's
+            # timestamp granularity cannot leave a stale entry behind
+            stat = self.config_path.stat()
+            Config._cache[self.config_path.absolute()] = ((stat.st_mtime_ns, stat.st_size), copy.deepcopy(data))
             self.logger.info(f"Configuration saved to {self.config_path}")
         except IOError as e:
             self.logger.error(f"Failed to save configuration: {e}")
@@ -101,7 +137,8 @@ class Config:
         """
         Get configuration value by key.
         
-        Automatically loads configuration if not already loaded.
+        Loads the configuration, reusing the cached parse while the file is
+        unchanged.
         
         Args:
             key: Configuration key to retrieve
@@ -110,9 +147,9 @@ class Config:
         Returns:
             Configuration value or default
         """
-        if not self._data:
-            self.load()
-        return self._data.get(key, default)
+        # Copy only the requested value out of the shared parse
+        data = self._parsed()
+        return copy.deepcopy(data[key]) if key in data else default
     
     def get_platform_config(self, platform: str) -> Dict[str, Any]:
         """
@@ -3,8 +3,10 @@ Comprehensive error handling for DeployX
 """
 
 import time
+import random
 import requests
-from typing import Callable, Any
+from typing import Callable, Any, Optional
+from urllib3.exceptions import NewConnectionError
 from functools import wraps
 
 from .ui import warning, info
@@ -70,6 +72,71 @@ def retry_with_backoff(max_retries: int = 3, base_delay: float = 1.0):
         return wrapper
     return decorator
 
+# HTTP status codes that signal rate limiting or a transient upstream failure
+RETRYABLE_STATUS_CODES = {429, 502, 503, 504}
+
+# Status codes that mean the server did not act on the request at all, so
+# even a non-idempotent request can be resent safely
+UNPROCESSED_STATUS_CODES = {429}
+
+# Methods that can be repeated without changing the result
+IDEMPOTENT_METHODS = {'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'}
+
+def _request_not_sent(e: requests.RequestException) -> bool:
+    """Check whether a request failed before any of it reached the server"""
+    if isinstance(e, requests.exceptions.ConnectTimeout):
+        return True
+    reason = getattr(e.args[0], 'reason', None) if e.args else None
+    return isinstance(reason, NewConnectionError)
+
+def request_with_backoff(session: requests.Session, method: str, url: str,
+                         max_attempts: int = 8, base_delay: float = 0.25,
+                         max_delay: float = 30.0, idempotent: Optional[bool] = None,
+                         **kwargs) -> requests.Response:
+    """
+    Send an HTTP request, retrying rate limits and transient failures with jittered backoff.
+    
+    Idempotent requests (by default, those with an idempotent method) retry on
+    any retryable status, timeout or connection error. Others, such as POSTs
+    that create resources, only retry when the server cannot have acted on
+    them: a 429, or a connection that failed before the request was sent.
+    """
+    body = kwargs.get('data')
+    send = getattr(session, method.lower())
+    if idempotent is None:
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+    retryable_status = RETRYABLE_STATUS_CODES if idempotent else UNPROCESSED_STATUS_CODES
+    
+    for attempt in range(max_attempts):
+        # Rewind streamed bodies consumed by a previous attempt
+        if attempt and hasattr(body, 'seek'):
+            body.seek(0)
+        
+        try:
+            response = send(url, **kwargs)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            if attempt == max_attempts - 1 or not (idempotent or _request_not_sent(e)):
+                raise
+            response = None
+        
+        if response is not None:
+            if response.status_code not in retryable_status or attempt == max_attempts - 1:
+                return response
+        
+        delay = min(max_delay, base_delay * (2 ** attempt) + random.uniform(0, base_delay))
+        
+        # Honor the server's Retry-After hint when it is given in seconds
+        retry_after = response.headers.get('Retry-After') if response is not None else None
+        if retry_after:
+            try:
+                delay = min(max_delay, float(retry_after))
+            except (TypeError, ValueError):
+                pass
+        
+        time.sleep(delay)
+    
+    return response
+
 def handle_network_error(e: Exception) -> NetworkError:
     """Convert network exceptions to NetworkError with suggestions"""
     if "timeout" in str(e).lower():
@@ -0,0 +1,33 @@
+"""
+Quiet .gitignore maintenance for files DeployX writes into projects.
+"""
+from pathlib import Path
+
+def add_to_existing_gitignore(project_path: Path, entry: str) -> bool:
+    """
+    Append entry to the project's .gitignore if the file exists.
+    
+    Prints nothing and never creates a .gitignore, so it is safe to call
+    from background caches in directories that are not git repositories.
+    
+    Args:
+        project_path: Path to project directory
+        entry: Entry to add to .gitignore
+    
+    Returns:
+        True if entry was appended, False if it was already listed or there
+        is no .gitignore
+    """
+    gitignore_path = Path(project_path) / ".gitignore"
+    
+    try:
+        content = gitignore_path.read_text()
+    except FileNotFoundError:
+        return False
+    
+    if entry in content.splitlines():
+        return False
+    
+    with open(gitignore_path, 'a') as f:
+        f.write(f'{entry}\n' if not content or content.endswith('\n') else f'\n{entry}\n')
+    return True